@@ -0,0 +1,277 @@
+"""
+Benchmarks for every panchang stage, plus a correctness check against a fixed reference.
+
+    python benchmarks/run.py --ephemeris /path/to/de421.bsp
+    python benchmarks/run.py --ephemeris de421.bsp --output results.json --baseline last.json
+    python benchmarks/run.py --ephemeris de421.bsp --quick          # days and months only
+
+Runs offline: the ephemeris is read from the given file and never downloaded, and the
+timescale uses Skyfield's built-in tables. Every timed run starts from a fresh Panchang
+with the shared sankranti and eclipse caches emptied, so the numbers are what a new
+process would see. Results are written as JSON; the exit status is 1 when a reference
+check fails or a benchmark is over its threshold (thresholds.json) or slower than the
+baseline by more than --tolerance (and --min-delta seconds).
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from datetime import date, datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+import numpy as np
+import skyfield
+
+from ind_panchang import panchang as core
+from ind_panchang.ephemeris import use_ephemeris
+from ind_panchang.panchang import Panchang
+
+REFERENCE_FILE = os.path.join(BENCH_DIR, "reference.json")
+THRESHOLDS_FILE = os.path.join(BENCH_DIR, "thresholds.json")
+
+LOCATION = (22.5726, 88.3639, "Asia/Kolkata", "Kolkata")
+ZONE = ZoneInfo(LOCATION[2])
+DAY = datetime(2025, 10, 1, 12, tzinfo=ZONE)
+ECLIPSE_DAY = datetime(2025, 9, 7, 22, tzinfo=ZONE)
+YEAR = 2025
+
+REFERENCE_DAYS = ["2025-01-14", "2025-04-14", "2025-06-21", "2025-09-07", "2025-10-01", "2025-10-20", "2026-03-21"]
+REFERENCE_MONTHS = [(2025, 10), (2026, 4)]
+REFERENCE_ECLIPSE_YEARS = (2025, 2026)
+
+
+# ---------------- HELPERS ----------------
+
+def reset_caches():
+    core.sankranti_index.clear()
+    core.eclipse_index.clear()
+
+
+def fresh_panchang():
+    reset_caches()
+    return Panchang(*LOCATION)
+
+
+def days_of(year, month=None):
+    """Local noons of every day in a month, or in a year when month is None."""
+    start = date(year, month or 1, 1)
+    if month is None:
+        end = date(year + 1, 1, 1)
+    else:
+        end = (start + timedelta(days=32)).replace(day=1)
+    return [datetime(d.year, d.month, d.day, 12, tzinfo=ZONE) for d in (start + timedelta(days=i) for i in range((end - start).days))]
+
+
+def minute(moment):
+    return None if moment is None else moment.astimezone(ZONE).strftime("%Y-%m-%d %H:%M")
+
+
+# ---------------- BENCHMARKS ----------------
+
+def each_day(method, days):
+    def run(p):
+        for d in days:
+            getattr(p, method)(d)
+    return run
+
+
+def benchmarks(quick=False):
+    """(name, scale, calls, run) where run(panchang) does the work being timed."""
+    month, year = days_of(YEAR, 10), days_of(YEAR)
+    month_start, month_end = datetime(YEAR, 10, 1, tzinfo=ZONE), datetime(YEAR, 11, 1, tzinfo=ZONE)
+    year_start, year_end = datetime(YEAR, 1, 1, tzinfo=ZONE), datetime(YEAR + 1, 1, 1, tzinfo=ZONE)
+    suite = [
+        ("get_tithi_events", "day", 1, lambda p: p.get_tithi_events(DAY)),
+        ("get_tithi_events", "month", len(month), each_day("get_tithi_events", month)),
+        ("iter_tithi_timeline", "month", 1, lambda p: list(p.iter_tithi_timeline(month_start, month_end))),
+        ("get_sunrise_sunset", "day", 1, lambda p: p.get_sunrise_sunset(DAY)),
+        ("get_sunrise_sunset", "month", len(month), each_day("get_sunrise_sunset", month)),
+        ("get_rise_set_table", "month", 1, lambda p: p.get_rise_set_table(month_start.date(), month_end.date())),
+        ("compute_bengali_month_day", "day", 1, lambda p: p.compute_bengali_month_day(DAY)),
+        ("compute_bengali_month_day", "month", len(month), each_day("compute_bengali_month_day", month)),
+        ("detect_eclipses", "day", 1, lambda p: p.detect_eclipses(DAY)),
+        ("detect_eclipses", "eclipse day", 1, lambda p: p.detect_eclipses(ECLIPSE_DAY)),
+        ("detect_eclipses", "month", len(month), each_day("detect_eclipses", month)),
+        ("daily_panchang", "day", 1, lambda p: p.daily_panchang(DAY)),
+        ("daily_panchang", "eclipse day", 1, lambda p: p.daily_panchang(ECLIPSE_DAY)),
+        ("daily_panchang", "month", len(month), each_day("daily_panchang", month)),
+        ("get_monthly_festivals", "month", 1, lambda p: p.get_monthly_festivals(YEAR, 10)),
+    ]
+    if not quick:
+        suite += [
+            ("get_tithi_events", "year", len(year), each_day("get_tithi_events", year)),
+            ("iter_tithi_timeline", "year", 1, lambda p: list(p.iter_tithi_timeline(year_start, year_end))),
+            ("get_sunrise_sunset", "year", len(year), each_day("get_sunrise_sunset", year)),
+            ("get_rise_set_table", "year", 1, lambda p: p.get_rise_set_table(year_start.date(), year_end.date())),
+            ("compute_bengali_month_day", "year", len(year), each_day("compute_bengali_month_day", year)),
+            ("detect_eclipses", "year", len(year), each_day("detect_eclipses", year)),
+            ("get_eclipse_catalog", "year", 1, lambda p: p.get_eclipse_catalog(YEAR, YEAR)),
+            ("get_monthly_festivals", "year", 12, lambda p: [p.get_monthly_festivals(YEAR, m) for m in range(1, 13)]),
+        ]
+    return suite
+
+
+def time_benchmark(run, repeats):
+    timings = []
+    for _ in range(repeats):
+        p = fresh_panchang()
+        started = time.perf_counter()
+        run(p)
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+# ---------------- REFERENCE DATA ----------------
+
+def snapshot():
+    """The reference quantities as computed by the current code, in the reference.json layout."""
+    p = fresh_panchang()
+    days = {}
+    for iso in REFERENCE_DAYS:
+        d = datetime.fromisoformat(iso).replace(hour=12, tzinfo=ZONE)
+        day = p.daily_panchang(d)
+        days[iso] = {
+            "bengali_date": list(day["bengali_date"]),
+            "lunar_month": day["lunar_month"],
+            "tithi": day["tithi"], "paksha": day["paksha"],
+            "nakshatra": day["nakshatra"], "yoga": day["yoga"], "karana": day["karana"],
+            "sunrise": minute(day["sunrise"]), "sunset": minute(day["sunset"]),
+            "moonrise": minute(day["moonrise"]), "moonset": minute(day["moonset"]),
+            "tithi_events": [[t["name"], minute(t["start"]), minute(t["end"])] for t in day["tithi_events"]],
+            "festivals": list(day["festivals"]),
+            "eclipses": [[name, minute(s), minute(m), minute(e)] for name, s, m, e in day["eclipses"]],
+        }
+    months = {
+        f"{y}-{m:02d}": [[fest, minute(s), minute(e)] for fest, s, e in p.get_monthly_festivals(y, m)]
+        for y, m in REFERENCE_MONTHS
+    }
+    eclipses = [
+        [f"{e['type']} {e['kind']}", minute(e["max"]), round(e["magnitude"], 3), e["visible"]]
+        for e in p.get_eclipse_catalog(*REFERENCE_ECLIPSE_YEARS)
+    ]
+    return {"days": days, "monthly_festivals": months, "eclipse_catalog": eclipses}
+
+
+def same(expected, actual, tolerance_minutes):
+    """Compares reference values, letting 'YYYY-MM-DD HH:MM' times and magnitudes differ slightly."""
+    if isinstance(expected, list) and isinstance(actual, list):
+        return len(expected) == len(actual) and all(same(e, a, tolerance_minutes) for e, a in zip(expected, actual))
+    if isinstance(expected, dict) and isinstance(actual, dict):
+        return expected.keys() == actual.keys() and all(same(expected[k], actual[k], tolerance_minutes) for k in expected)
+    if isinstance(expected, float) and isinstance(actual, float):
+        return abs(expected - actual) <= 0.002
+    if isinstance(expected, str) and isinstance(actual, str) and len(expected) == 16 and expected[4] == "-" and expected[13] == ":":
+        try:
+            gap = abs(datetime.fromisoformat(expected) - datetime.fromisoformat(actual))
+        except ValueError:
+            return expected == actual
+        return gap <= timedelta(minutes=tolerance_minutes)
+    return expected == actual
+
+
+def check_reference(reference):
+    tolerance = reference.get("tolerance_minutes", 1)
+    current = snapshot()
+    checks = []
+    for section in ("days", "monthly_festivals"):
+        for key, expected in reference[section].items():
+            actual = current[section].get(key)
+            ok = same(expected, actual, tolerance)
+            checks.append({"name": f"{section}/{key}", "status": "ok" if ok else "fail",
+                           "detail": None if ok else {"expected": expected, "actual": actual}})
+    ok = same(reference["eclipse_catalog"], current["eclipse_catalog"], tolerance)
+    checks.append({"name": "eclipse_catalog", "status": "ok" if ok else "fail",
+                   "detail": None if ok else {"expected": reference["eclipse_catalog"], "actual": current["eclipse_catalog"]}})
+    return checks
+
+
+# ---------------- MAIN ----------------
+
+def load_json(path):
+    if not path or not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time every panchang stage and check results against the reference data.")
+    parser.add_argument("--ephemeris", default=os.environ.get("IND_PANCHANG_EPHEMERIS", "de421.bsp"),
+                        help="local JPL ephemeris file (never downloaded)")
+    parser.add_argument("--output", help="write the JSON results here as well as to standard output")
+    parser.add_argument("--baseline", help="results of an earlier run to compare against")
+    parser.add_argument("--tolerance", type=float, default=1.25, help="allowed slowdown against the baseline (ratio)")
+    parser.add_argument("--min-delta", type=float, default=0.02,
+                        help="slowdowns smaller than this many seconds are timer noise, not regressions")
+    parser.add_argument("--repeat", type=int, default=3, help="runs of each day/month benchmark (year benchmarks run once)")
+    parser.add_argument("--quick", action="store_true", help="skip the year-long benchmarks")
+    parser.add_argument("--only", help="run only benchmarks whose name contains this")
+    parser.add_argument("--write-reference", action="store_true", help="regenerate reference.json from the current code and exit")
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.ephemeris):
+        parser.error(f"ephemeris file {args.ephemeris!r} not found; the benchmarks never download it")
+    use_ephemeris(args.ephemeris)
+
+    if args.write_reference:
+        with open(REFERENCE_FILE, "w", encoding="utf-8") as f:
+            json.dump(dict(snapshot(), location=list(LOCATION), tolerance_minutes=1), f, indent=1, ensure_ascii=False)
+            f.write("\n")
+        print(f"wrote {REFERENCE_FILE}")
+        return 0
+
+    thresholds = load_json(THRESHOLDS_FILE)
+    baseline = {f"{b['name']}/{b['scale']}": b["median_s"] for b in load_json(args.baseline).get("benchmarks", [])}
+    results = []
+    for name, scale, calls, run in benchmarks(args.quick):
+        if args.only and args.only not in name:
+            continue
+        key = f"{name}/{scale}"
+        timings = time_benchmark(run, 1 if scale == "year" else args.repeat)
+        median = statistics.median(timings)
+        status = "ok"
+        if key in thresholds and median > thresholds[key]:
+            status = "over threshold"
+        elif key in baseline and median > baseline[key] * args.tolerance and median - baseline[key] > args.min_delta:
+            status = "regression"
+        results.append({
+            "name": name, "scale": scale, "calls": calls, "repeats": len(timings),
+            "min_s": round(min(timings), 4), "median_s": round(median, 4),
+            "per_call_s": round(median / calls, 5),
+            "threshold_s": thresholds.get(key), "baseline_s": baseline.get(key), "status": status,
+        })
+        print(f"{key:42s} {median:9.3f}s  {status}", file=sys.stderr)
+
+    checks = check_reference(load_json(REFERENCE_FILE))
+    for check in checks:
+        if check["status"] != "ok":
+            print(f"reference check failed: {check['name']}", file=sys.stderr)
+
+    report = {
+        "suite": "ind-panchang",
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "environment": {
+            "python": platform.python_version(), "platform": platform.platform(),
+            "numpy": np.__version__, "skyfield": skyfield.__version__,
+            "ephemeris": os.path.basename(args.ephemeris),
+        },
+        "benchmarks": results,
+        "checks": checks,
+        "passed": all(r["status"] == "ok" for r in results) and all(c["status"] == "ok" for c in checks),
+    }
+    text = json.dumps(report, indent=1)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    print(text)
+    return 0 if report["passed"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
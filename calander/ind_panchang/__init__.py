@@ -0,0 +1,30 @@
+"""
+Ind-Panchang: Bengali tithis, festivals and eclipses computed with Skyfield.
+
+Importing the package has no side effects; the ephemeris is loaded the first time
+a Panchang needs it.
+"""
+from .panchang import (
+    Panchang,
+    DEFAULT_ZONE,
+    AYANAMSHA,
+    get_festivals,
+    get_sankrantis,
+    find_sankranti,
+    bengali_months,
+    lunar_months,
+    nakshatras,
+    yogas,
+    karanas,
+)
+from .ephemeris import get_timescale, get_ephemeris
+from .chebyshev import ChebyshevModel, use_fast_path
+from .festivals import FestivalRegistry, festival_registry, load_festival_rules, RULES_DIR
+from .hijri import HijriTable, hijri_date
+from .cache import AlmanacCache, CachedPanchang, StaleCacheError
+from .batch import batch_daily_panchang, rise_set_many
+from .almanac import build_almanac, iter_almanac
+from .live import LivePanchang
+from .records import DaySheet, Eclipse, Festival, Span, SpanArray
+
+__version__ = "2.0"
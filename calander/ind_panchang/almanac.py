@@ -0,0 +1,128 @@
+"""
+Multi-year festival almanac built in parallel.
+
+The year range is cut into chunks of whole months and each chunk is computed in a
+worker process that loads the ephemeris once and keeps its own Panchang. A tithi
+that runs across a chunk edge is reported by both neighbouring chunks; the merge
+keeps the first copy, so nothing is lost or repeated. Each chunk searches its own
+time window, so a transition found by two chunks can differ by some microseconds;
+the merge moves it onto the time already reported, so adjacent tithis still share
+their boundary exactly. The festivals and dates are the same for any worker count or
+chunk size, and their times agree with a single serial search to within a millisecond.
+"""
+import argparse
+import os
+from datetime import datetime, timedelta
+
+from .ephemeris import init_worker, worker_pool
+from .festivals import festival_registry, load_festival_rules
+from .panchang import Panchang, DEFAULT_ZONE
+
+# two reports of the same tithi from neighbouring chunks differ by far less than this
+SAME_TITHI_TOLERANCE = timedelta(seconds=60)
+
+_worker_panchang = None
+
+
+def _init_worker(latitude, longitude, zone, name, rules, ephemeris_file):
+    global _worker_panchang
+    init_worker(ephemeris_file)
+    # rules loaded in the parent after import are not there in a spawned worker
+    for rule in rules:
+        festival_registry.add(rule)
+    _worker_panchang = Panchang(latitude, longitude, zone, name)
+
+
+def _festival_chunk(bounds):
+    start, end = bounds
+    return _worker_panchang.get_festivals_between(start, end)
+
+
+def month_chunks(panchang, start_year, end_year, chunk_months=6):
+    """Local (start, end) pairs covering January of start_year to December of end_year, chunk_months at a time."""
+    months = [(year, month) for year in range(start_year, end_year + 1) for month in range(1, 13)]
+    edges = [datetime(y, m, 1, tzinfo=panchang.zone) for y, m in months[::chunk_months]]
+    edges.append(datetime(end_year + 1, 1, 1, tzinfo=panchang.zone))
+    return list(zip(edges[:-1], edges[1:]))
+
+
+def _snap(moment, boundaries):
+    """The boundary already reported for the same transition as moment, or moment itself."""
+    for seen in boundaries:
+        if abs(moment - seen) < SAME_TITHI_TOLERANCE:
+            return seen
+    return moment
+
+
+def iter_merged(chunks):
+    """
+    Yields the festivals of per-chunk lists (given in chunk order) as one ordered stream,
+    dropping the second report of a tithi festival that straddles a chunk edge and moving
+    tithi starts and ends onto the same transition as reported by the previous chunk.
+    Only the previous chunk is held, so the stream can be as long as you like.
+    """
+    previous, boundaries = [], []
+    for festivals in chunks:
+        reported = []  # tithi boundaries yielded from this chunk
+        for fest, start, end in festivals:
+            if start != end:
+                if any(fest == seen and abs(start - seen_start) < SAME_TITHI_TOLERANCE for seen, seen_start, _ in previous):
+                    continue
+                start, end = _snap(start, boundaries), _snap(end, boundaries)
+                reported += (start, end)
+                boundaries += (start, end)
+            yield fest, start, end
+        previous, boundaries = festivals, reported
+
+
+def merge_chunks(chunks):
+    """Joins per-chunk festival lists (in chunk order) into one ordered list; see iter_merged()."""
+    return list(iter_merged(chunks))
+
+
+def iter_almanac(panchang, start_year, end_year, chunk_months=1):
+    """Streams the festivals from start_year to end_year inclusive in this process, chunk by chunk."""
+    chunks = month_chunks(panchang, start_year, end_year, chunk_months)
+    return iter_merged(panchang.get_festivals_between(start, end) for start, end in chunks)
+
+
+def build_almanac(panchang, start_year, end_year, workers=None, chunk_months=6):
+    """
+    Festivals from start_year to end_year inclusive as one ordered list of (name, start, end)
+    tuples, computed by a pool of `workers` processes (every core by default).
+    """
+    chunks = month_chunks(panchang, start_year, end_year, chunk_months)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        return merge_chunks(panchang.get_festivals_between(start, end) for start, end in chunks)
+    init_args = (panchang.latitude, panchang.longitude, panchang.zone.key, panchang.name, festival_registry.rules)
+    with worker_pool(workers, _init_worker, init_args) as pool:
+        # map() hands results back in chunk order, whatever order the workers finish in
+        return merge_chunks(pool.map(_festival_chunk, chunks))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Print the festivals of a range of years.")
+    parser.add_argument("start_year", type=int)
+    parser.add_argument("end_year", type=int)
+    parser.add_argument("--latitude", type=float, default=23.8315)
+    parser.add_argument("--longitude", type=float, default=91.2868)
+    parser.add_argument("--zone", default=DEFAULT_ZONE)
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: every core)")
+    parser.add_argument("--chunk-months", type=int, default=6)
+    parser.add_argument("--rules", action="append", default=[], help="extra festival rule file (JSON), may be repeated")
+    args = parser.parse_args(argv)
+
+    for rules_file in args.rules:
+        load_festival_rules(rules_file)
+
+    panchang = Panchang(args.latitude, args.longitude, args.zone)
+    for fest, start, end in build_almanac(panchang, args.start_year, args.end_year, args.workers, args.chunk_months):
+        if start == end:
+            print(f"{start.strftime('%Y-%m-%d')}\t{fest}")
+        else:
+            print(f"{start.strftime('%Y-%m-%d %H:%M:%S')}\t{end.strftime('%Y-%m-%d %H:%M:%S')}\t{fest}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""
+Panchang for many places at once.
+
+Tithi, nakshatra, yoga, karana, moon phases and sankrantis do not depend on where
+you stand, so they are computed once for the whole batch. Only sunrise/sunset,
+moonrise/moonset, the sunrise-anchored Bengali date and local eclipse visibility are
+worked out per place, and rise/set times for every place are found together with
+vectorized Skyfield calls instead of one search per place.
+"""
+from datetime import timedelta
+
+import numpy as np
+from skyfield.api import wgs84
+from skyfield.almanac import moon_phases
+from skyfield.nutationlib import iau2000b_radians
+
+from .ephemeris import get_timescale, get_ephemeris, get_bodies
+from .instrument import find_discrete, observed, timed
+from .names import PHASE_NAMES
+from .panchang import (
+    ANGULAR_EVENTS, Panchang, eclipse_syzygies, find_sankranti, get_sankrantis,
+    global_lunar_eclipse, global_solar_eclipse, to_utc,
+)
+
+# same horizon as skyfield.almanac.risings_and_settings()
+HORIZON_DEGREES = -34.0 / 60.0
+# one millisecond, like find_discrete()
+EPSILON_DAYS = 0.001 / 86400
+
+
+def as_panchangs(locations):
+    """Accepts Panchang objects or (latitude, longitude, zone[, name]) tuples."""
+    return [loc if isinstance(loc, Panchang) else Panchang(*loc) for loc in locations]
+
+
+def _altitudes(body, jd, latitudes, longitudes):
+    ts = get_timescale()
+    earth = get_bodies()[0]
+    t = ts.tt_jd(jd)
+    t._nutation_angles_radians = iau2000b_radians(t)
+    observed(t)
+    return (earth + wgs84.latlon(latitudes, longitudes)).at(t).observe(body).apparent().altaz()[0].degrees
+
+
+@timed("batch.rise_set_many")
+def rise_set_many(panchangs, days, bodies=("sun", "moon"), samples_per_day=24):
+    """
+    Rise and set times of the sun and/or moon for each (panchang, local day) pair.
+
+    Every pair is sampled on an hourly grid in a single vectorized call, then all the
+    brackets where the body crosses the horizon are bisected together. Returns one tuple
+    per pair: (sunrise, sunset, moonrise, moonset), or only the requested bodies' times,
+    with None for a day on which the body does not rise or set.
+    """
+    ts = get_timescale()
+    _, sun, moon = get_bodies()
+    targets = {"sun": sun, "moon": moon}
+    n = len(panchangs)
+    latitudes = np.array([p.latitude for p in panchangs], dtype=float)
+    longitudes = np.array([p.longitude for p in panchangs], dtype=float)
+    bounds = [p.day_bounds(d) for p, d in zip(panchangs, days)]
+    starts = ts.from_datetimes([to_utc(b[0]) for b in bounds]).tt
+    ends = ts.from_datetimes([to_utc(b[1]) for b in bounds]).tt
+    grid = starts[:, None] + (ends - starts)[:, None] * np.linspace(0, 1, samples_per_day + 1)[None, :]
+
+    results = [[] for _ in range(n)]
+    for body_name in bodies:
+        body = targets[body_name]
+        lat_grid = np.repeat(latitudes, grid.shape[1])
+        lon_grid = np.repeat(longitudes, grid.shape[1])
+        up = (_altitudes(body, grid.ravel(), lat_grid, lon_grid) > HORIZON_DEGREES).reshape(grid.shape)
+        rows, cols = np.nonzero(up[:, 1:] != up[:, :-1])
+        lo, hi = grid[rows, cols], grid[rows, cols + 1]
+        lo_up = up[rows, cols]
+        while len(rows) and np.max(hi - lo) > EPSILON_DAYS:
+            mid = (lo + hi) / 2
+            mid_up = _altitudes(body, mid, latitudes[rows], longitudes[rows]) > HORIZON_DEGREES
+            same = mid_up == lo_up
+            lo = np.where(same, mid, lo)
+            hi = np.where(same, hi, mid)
+        rise = [None] * n
+        setting = [None] * n
+        # rows come out of np.nonzero in time order per location, so the first event of a day wins
+        for i, when, rising in zip(rows, (lo + hi) / 2, ~lo_up):
+            column = rise if rising else setting
+            if column[i] is None:
+                column[i] = panchangs[i].to_local(ts.tt_jd(when).utc_datetime())
+        for i in range(n):
+            results[i] += [rise[i], setting[i]]
+    return [tuple(r) for r in results]
+
+
+def _localize(span, panchang):
+    local = dict(span)
+    local["start"], local["end"] = panchang.to_local(span["start"]), panchang.to_local(span["end"])
+    return local
+
+
+@timed("batch.daily_panchang")
+def batch_daily_panchang(locations, date_input=None):
+    """
+    Daily sheets for many places for the same instant, in the order given.
+    Each sheet has the same keys as Panchang.daily_panchang().
+    """
+    panchangs = as_panchangs(locations)
+    if not panchangs:
+        return []
+    ts = get_timescale()
+    instant = date_input or panchangs[0].now()
+    days = [instant.astimezone(p.zone) for p in panchangs]
+    bounds = [p.day_bounds(d) for p, d in zip(panchangs, days)]
+    window_start = min(b[0] for b in bounds)
+    window_end = max(b[1] for b in bounds)
+
+    # --- Topocentric, vectorized across places ---
+    for p, d, times in zip(panchangs, days, rise_set_many(panchangs, days)):
+        p.rise_set_days[d.toordinal()] = times
+    # sunrise on each place's ingress day decides which local day a Bengali month starts
+    needed = []
+    for p, d, (_, day_end) in zip(panchangs, days, bounds):
+        mesha_ingress = next(t for t, r in zip(*get_sankrantis(d.year)) if r == 0)
+        ingresses = {find_sankranti(day_end)[0], find_sankranti(day_end, offset=-1)[0], mesha_ingress}
+        needed += [(p, ingress) for ingress in ingresses if ingress not in p.sankranti_month_starts]
+    if needed:
+        sunrises = rise_set_many([p for p, _ in needed], [p.to_local(i) for p, i in needed], bodies=("sun",))
+        for (p, ingress), (sunrise, _) in zip(needed, sunrises):
+            if sunrise is not None:
+                local_ingress = p.to_local(ingress)
+                start = local_ingress.date() if sunrise >= ingress else local_ingress.date() + timedelta(days=1)
+                p.sankranti_month_starts[ingress] = start
+
+    # --- Geocentric, computed once ---
+    first = panchangs[0]
+    shared_spans = {kind: first.get_angular_events(kind, window_start, window_end) for kind in ANGULAR_EVENTS}
+    longitudes = (first.sun_longitude(instant), first.moon_longitude(instant))
+    t0, t1 = ts.from_datetime(to_utc(window_start)), ts.from_datetime(to_utc(window_end))
+    phase_times, phase_events = find_discrete(t0, t1, moon_phases(get_ephemeris()))
+    phases = [(PHASE_NAMES[int(e)], when) for when, e in zip(phase_times.utc_datetime(), phase_events)]
+    # only syzygies that actually produce an eclipse are looked at from each place
+    eclipse_times = [
+        (t, phase) for t, phase in eclipse_syzygies(
+            ts.from_datetime(to_utc(window_start - timedelta(days=1))), ts.from_datetime(to_utc(window_end + timedelta(days=1))))
+        if (global_solar_eclipse(t) if phase == 0 else global_lunar_eclipse(t)) is not None
+    ]
+
+    sheets = []
+    for p, d, (day_start, day_end) in zip(panchangs, days, bounds):
+        spans = {
+            kind: [_localize(s, p) for s in shared if s["end"] > day_start and s["start"] < day_end]
+            for kind, shared in shared_spans.items()
+        }
+        day_phases = [(name, p.to_local(when)) for name, when in phases if day_start <= when < day_end]
+        local_eclipses = [p.solar_eclipse_at(t) if phase == 0 else p.lunar_eclipse_at(t) for t, phase in eclipse_times]
+        eclipses = p.eclipses_on_day(local_eclipses, d)
+        sheets.append(p.assemble_day(d, longitudes, spans, day_phases, eclipses))
+    return sheets
@@ -0,0 +1,313 @@
+"""
+Persistent on-disk cache of computed almanac events.
+
+Events are kept as sorted NumPy structured arrays in ``.npy`` files that are
+memory-mapped on read, so a range query is a binary search over the time column
+instead of a parse of the whole file. Coverage is tracked per calendar month and
+missing months are computed and merged in on demand.
+
+Geocentric transitions (tithi, nakshatra, yoga, karana, moon phases) live in one
+store shared by every location; rise/set tables and eclipses with local
+visibility live in one store per (location, timezone). Each store records the
+ephemeris file, the segments of its kernel (bodies and coverage) and the ayanamsha it
+was built with. Opening a store built with different settings, such as another or
+re-trimmed kernel, raises StaleCacheError until AlmanacCache.invalidate() is called.
+"""
+import json
+import os
+import shutil
+import threading
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+import numpy as np
+from skyfield.almanac import moon_phases
+
+from . import ephemeris
+from . import panchang as core
+from .instrument import find_discrete
+from .names import PHASE_NAMES
+from .panchang import Panchang, RISESET_DTYPE, angular_span, to_utc
+
+FORMAT_VERSION = 1
+
+TRANSITION_DTYPE = np.dtype([("time", "<f8"), ("index", "<i2")])
+ECLIPSE_DTYPE = np.dtype([
+    ("max", "<f8"), ("start", "<f8"), ("end", "<f8"),
+    ("kind", "<i1"), ("type", "<i1"), ("magnitude", "<f4"), ("visible", "?"), ("local_magnitude", "<f4"),
+    ("local_start", "<f8"), ("local_max", "<f8"), ("local_end", "<f8"),
+])
+
+GEOCENTRIC_KINDS = ("tithi", "nakshatra", "yoga", "karana", "phase")
+ECLIPSE_KINDS = ["Solar Eclipse", "Lunar Eclipse"]
+ECLIPSE_TYPES = ["Partial", "Total", "Annular", "Penumbral"]
+
+
+class StaleCacheError(Exception):
+    """A cache store was built with a different ephemeris or ayanamsha."""
+
+
+def month_index(dt):
+    return dt.year * 12 + dt.month - 1
+
+def month_start(index, zone):
+    return datetime(index // 12, index % 12 + 1, 1, tzinfo=zone)
+
+def months_between(start, end):
+    """Month indices touched by [start, end)."""
+    return range(month_index(start), month_index(end - timedelta(microseconds=1)) + 1)
+
+def month_runs(months):
+    """Groups sorted month indices into (first, last) runs of consecutive months."""
+    runs = []
+    for m in months:
+        if runs and runs[-1][1] == m - 1:
+            runs[-1][1] = m
+        else:
+            runs.append([m, m])
+    return [tuple(run) for run in runs]
+
+def to_seconds(dt):
+    return dt.timestamp() if dt is not None else np.nan
+
+def from_seconds(seconds, zone):
+    return None if np.isnan(seconds) else datetime.fromtimestamp(float(seconds), tz=zone)
+
+
+class _Store:
+    """One directory of ``<kind>.npy`` arrays plus a ``meta.json`` coverage record."""
+
+    def __init__(self, path, settings):
+        self.path = path
+        self.settings = settings
+        self.arrays = {}
+        os.makedirs(path, exist_ok=True)
+        meta_path = os.path.join(path, "meta.json")
+        if os.path.exists(meta_path):
+            with open(meta_path) as f:
+                self.meta = json.load(f)
+            if self.meta["settings"] != settings:
+                raise StaleCacheError(
+                    f"{path} was built with {self.meta['settings']}, not {settings}; "
+                    "call AlmanacCache.invalidate() to rebuild it"
+                )
+        else:
+            self.meta = {"settings": settings, "coverage": {}}
+            self._write_meta()
+
+    def _write_meta(self):
+        tmp = os.path.join(self.path, "meta.json.tmp")
+        with open(tmp, "w") as f:
+            json.dump(self.meta, f)
+        os.replace(tmp, os.path.join(self.path, "meta.json"))
+
+    def missing(self, kind, months):
+        covered = set(self.meta["coverage"].get(kind, []))
+        return [m for m in months if m not in covered]
+
+    def load(self, kind, dtype):
+        if kind not in self.arrays:
+            path = os.path.join(self.path, f"{kind}.npy")
+            self.arrays[kind] = np.load(path, mmap_mode="r") if os.path.exists(path) else np.zeros(0, dtype)
+        return self.arrays[kind]
+
+    def merge(self, kind, records, months, key):
+        """Adds freshly computed records for the given months and rewrites the file atomically."""
+        existing = np.asarray(self.load(kind, records.dtype))
+        merged = np.concatenate([existing, records])
+        merged = merged[np.argsort(merged[key], kind="stable")]
+        if len(merged):
+            # a root on a month edge can be found by both neighbouring months
+            keep = np.ones(len(merged), dtype=bool)
+            keep[1:] = np.diff(merged[key]) > 1e-3
+            merged = merged[keep]
+        tmp = os.path.join(self.path, f"{kind}.tmp.npy")
+        np.save(tmp, merged)
+        os.replace(tmp, os.path.join(self.path, f"{kind}.npy"))
+        self.arrays.pop(kind, None)
+        self.meta["coverage"][kind] = sorted(set(self.meta["coverage"].get(kind, [])) | set(months))
+        self._write_meta()
+
+
+class AlmanacCache:
+    """Root directory holding the geocentric store and one store per location."""
+
+    def __init__(self, root):
+        self.root = root
+        self.stores = {}
+        self.lock = threading.RLock()
+
+    @staticmethod
+    def settings():
+        # lists, not tuples, so they compare equal to the settings read back from meta.json
+        return {
+            "format": FORMAT_VERSION,
+            "ephemeris": ephemeris.ephemeris_path() or ephemeris.EPHEMERIS_FILE,
+            "kernel": ephemeris.kernel_identity(),
+            "ayanamsha": core.AYANAMSHA,
+        }
+
+    @staticmethod
+    def location_key(panchang):
+        return f"{panchang.latitude:.4f}_{panchang.longitude:.4f}_{panchang.zone.key.replace('/', '-')}"
+
+    def store(self, name):
+        with self.lock:
+            if name not in self.stores:
+                self.stores[name] = _Store(os.path.join(self.root, name), self.settings())
+            return self.stores[name]
+
+    def invalidate(self, everything=False):
+        """
+        Deletes every store built with another ephemeris or ayanamsha (or all of them),
+        so they are rebuilt from scratch on next use.
+        """
+        with self.lock:
+            self.stores.clear()
+            if not os.path.isdir(self.root):
+                return
+            for name in os.listdir(self.root):
+                meta_path = os.path.join(self.root, name, "meta.json")
+                if not os.path.exists(meta_path):
+                    continue
+                with open(meta_path) as f:
+                    stale = json.load(f)["settings"] != self.settings()
+                if stale or everything:
+                    shutil.rmtree(os.path.join(self.root, name))
+
+
+class CachedPanchang(Panchang):
+    """
+    Panchang that reads tithi/nakshatra/yoga/karana transitions, moon phases,
+    rise/set times and eclipses from an AlmanacCache, computing only the months
+    that are not on disk yet.
+    """
+
+    def __init__(self, latitude, longitude, zone=core.DEFAULT_ZONE, name=None, cache=None):
+        super().__init__(latitude, longitude, zone, name)
+        if cache is None:
+            raise ValueError("CachedPanchang needs an AlmanacCache")
+        self.cache = cache
+
+    # ---------------- FILLING ----------------
+
+    def _utc_months(self, start, end):
+        return months_between(to_utc(start), to_utc(end))
+
+    def _ensure_transitions(self, kind, start, end):
+        store = self.cache.store("geocentric")
+        with self.cache.lock:
+            missing = store.missing(kind, self._utc_months(start, end))
+            if not missing:
+                return store
+            records = []
+            for first, last in month_runs(missing):
+                t0 = self.ts.from_datetime(month_start(first, ZoneInfo("UTC")))
+                t1 = self.ts.from_datetime(month_start(last + 1, ZoneInfo("UTC")))
+                if kind == "phase":
+                    times, indices = find_discrete(t0, t1, moon_phases(self.eph))
+                else:
+                    times, indices = core.find_angular_transitions(kind, t0, t1)
+                block = np.zeros(len(times), TRANSITION_DTYPE)
+                block["time"] = [when.timestamp() for when in times.utc_datetime()]
+                block["index"] = indices
+                records.append(block)
+            store.merge(kind, np.concatenate(records), missing, "time")
+            return store
+
+    def _ensure_riseset(self, start, end):
+        store = self.cache.store(self.cache.location_key(self))
+        with self.cache.lock:
+            missing = store.missing("riseset", months_between(start, end))
+            if not missing:
+                return store
+            tables = []
+            for first, last in month_runs(missing):
+                # one search per run of consecutive missing months
+                tables.append(super().get_rise_set_table(month_start(first, self.zone), month_start(last + 1, self.zone)))
+            store.merge("riseset", np.concatenate(tables), missing, "day")
+            return store
+
+    def _ensure_eclipses(self, start, end):
+        store = self.cache.store(self.cache.location_key(self))
+        with self.cache.lock:
+            missing = store.missing("eclipse", self._utc_months(start, end))
+            if not missing:
+                return store
+            rows = []
+            for m in missing:
+                block = super().iter_eclipses(month_start(m, ZoneInfo("UTC")), month_start(m + 1, ZoneInfo("UTC")))
+                for e in block:
+                    rows.append((
+                        to_seconds(e["max"]), to_seconds(e["start"]), to_seconds(e["end"]),
+                        ECLIPSE_KINDS.index(e["kind"]), ECLIPSE_TYPES.index(e["type"]), e["magnitude"],
+                        e["visible"], e["local_magnitude"], to_seconds(e.get("local_start")),
+                        to_seconds(e.get("local_max")), to_seconds(e.get("local_end")),
+                    ))
+            store.merge("eclipse", np.array(rows, ECLIPSE_DTYPE), missing, "max")
+            return store
+
+    # ---------------- QUERIES ----------------
+
+    def transitions(self, kind, start, end):
+        """Transition records of `kind` within [start, end), read from the memory-mapped file."""
+        events = self._ensure_transitions(kind, start, end).load(kind, TRANSITION_DTYPE)
+        i0, i1 = np.searchsorted(events["time"], [start.timestamp(), end.timestamp()])
+        return events[i0:i1]
+
+    def iter_angular_events(self, kind, t_start_local, t_end_local, chunk_days=30):
+        pad = timedelta(days=1.5)
+        events = self.transitions(kind, t_start_local - pad, t_end_local + pad)
+        times = events["time"]
+        # spans run from each transition to the next; keep those overlapping the requested range
+        i0 = max(int(np.searchsorted(times, t_start_local.timestamp(), side="right")) - 1, 0)
+        i1 = int(np.searchsorted(times, t_end_local.timestamp(), side="left"))
+        for j in range(i0, min(i1, len(times) - 1)):
+            start, end = from_seconds(times[j], self.zone), from_seconds(times[j + 1], self.zone)
+            yield angular_span(kind, events["index"][j], start, end)
+
+    def moon_phase_events(self, dt_local):
+        day_start, day_end = self.day_bounds(dt_local)
+        events = self.transitions("phase", day_start, day_end)
+        return [(PHASE_NAMES[int(e["index"])], from_seconds(e["time"], self.zone)) for e in events]
+
+    def _riseset_row(self, dt_local):
+        table = self._ensure_riseset(*self.day_bounds(dt_local)).load("riseset", RISESET_DTYPE)
+        i = int(np.searchsorted(table["day"], dt_local.toordinal()))
+        return table[i]
+
+    def get_rise_set_table(self, start_date, end_date):
+        start, _ = self.day_bounds(start_date)
+        end, _ = self.day_bounds(end_date)
+        table = self._ensure_riseset(start, end).load("riseset", RISESET_DTYPE)
+        i0, i1 = np.searchsorted(table["day"], [start_date.toordinal(), end_date.toordinal()])
+        return table[i0:i1]
+
+    def get_sunrise_sunset(self, dt_local):
+        row = self._riseset_row(dt_local)
+        return from_seconds(row["sunrise"], self.zone), from_seconds(row["sunset"], self.zone)
+
+    def get_moonrise_moonset(self, dt_local):
+        row = self._riseset_row(dt_local)
+        return from_seconds(row["moonrise"], self.zone), from_seconds(row["moonset"], self.zone)
+
+    def iter_eclipses(self, t_start_local, t_end_local):
+        # months are filled by syzygy time, which can sit a few hours either side of the maximum
+        pad = timedelta(days=1)
+        table = self._ensure_eclipses(t_start_local - pad, t_end_local + pad).load("eclipse", ECLIPSE_DTYPE)
+        i0, i1 = np.searchsorted(table["max"], [t_start_local.timestamp(), t_end_local.timestamp()])
+        for row in table[i0:i1]:
+            eclipse = {
+                "kind": ECLIPSE_KINDS[row["kind"]], "type": ECLIPSE_TYPES[row["type"]],
+                "magnitude": float(row["magnitude"]),
+                "start": from_seconds(row["start"], self.zone), "max": from_seconds(row["max"], self.zone),
+                "end": from_seconds(row["end"], self.zone),
+                "visible": bool(row["visible"]), "local_magnitude": float(row["local_magnitude"]),
+            }
+            if not np.isnan(row["local_max"]):
+                eclipse.update({
+                    "local_start": from_seconds(row["local_start"], self.zone),
+                    "local_max": from_seconds(row["local_max"], self.zone),
+                    "local_end": from_seconds(row["local_end"], self.zone),
+                })
+            yield eclipse
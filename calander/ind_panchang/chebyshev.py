@@ -0,0 +1,176 @@
+"""
+Piecewise-Chebyshev fast path for the apparent sun and moon positions.
+
+Every step of a tithi/nakshatra/yoga/karana or sankranti search otherwise runs a full
+Skyfield reduction (light time, aberration, nutation) for each sample. A model fitted
+once over a span of years answers the same apparent ecliptic longitudes, and the moon's
+latitude, with a few array operations:
+
+    model = ChebyshevModel.fit(2000, 2050)
+    model.verify()                      # max error of each quantity against Skyfield, in degrees
+    install(model)                      # used only where it covers the time asked about
+
+Searches then run on the model and only the roots they find are refined against Skyfield
+(refine_roots), so transition times stay exact. install() refuses a model whose verified
+error exceeds the tolerance and Skyfield stays in use. Refit after changing the ephemeris.
+"""
+import warnings
+
+import numpy as np
+from numpy.polynomial import chebyshev
+
+from .ephemeris import get_timescale, get_bodies
+
+QUANTITIES = ("sun_longitude", "moon_longitude", "moon_latitude")
+# 8-day segments of degree 14 stay within about 1e-8 degrees of Skyfield for 1900-2050
+SPAN_DAYS = 8.0
+DEGREE = 14
+# about 0.004 arcseconds, which the moon covers in under 10 milliseconds
+TOLERANCE_DEGREES = 1e-6
+
+installed = None  # the model in use, set by install()
+
+
+def apparent_positions(tt):
+    """Skyfield's (sun longitude, moon longitude, moon latitude) in degrees for TT Julian dates."""
+    earth, sun, moon = get_bodies()
+    e = earth.at(get_timescale().tt_jd(tt))
+    moon_lat, moon_lon, _ = e.observe(moon).apparent().ecliptic_latlon()
+    return e.observe(sun).apparent().ecliptic_latlon()[1].degrees, moon_lon.degrees, moon_lat.degrees
+
+
+class ChebyshevModel:
+    """
+    Chebyshev coefficients of each quantity over consecutive segments of `span_days`.
+    Longitudes are fitted unwrapped within a segment and folded back into [0, 360).
+    """
+
+    def __init__(self, start_tt, span_days, coefficients):
+        self.start_tt, self.span_days = float(start_tt), float(span_days)
+        self.coefficients = coefficients  # quantity -> (degree + 1, segments) array
+        self.segments = next(iter(coefficients.values())).shape[1]
+        self.end_tt = self.start_tt + self.segments * self.span_days
+        self.max_error = None  # quantity -> degrees, filled in by verify()
+
+    @classmethod
+    def fit(cls, start_year, end_year, span_days=SPAN_DAYS, degree=DEGREE):
+        """Fits January 1 of start_year to the end of end_year from one vectorized Skyfield call."""
+        ts = get_timescale()
+        start_tt, end_tt = ts.utc(start_year, 1, 1).tt - 1, ts.utc(end_year + 1, 1, 1).tt + 1
+        segments = int(np.ceil((end_tt - start_tt) / span_days))
+        nodes = np.cos(np.pi * (np.arange(degree + 1) + 0.5) / (degree + 1))
+        tt = start_tt + span_days * (np.arange(segments)[:, None] + (nodes[None, :] + 1) / 2)
+        coefficients = {}
+        for name, values in zip(QUANTITIES, apparent_positions(tt.ravel())):
+            values = values.reshape(tt.shape)
+            if name.endswith("longitude"):
+                values = np.unwrap(values, period=360, axis=1)
+            coefficients[name] = chebyshev.chebfit(nodes, values.T, degree)
+        return cls(start_tt, span_days, coefficients)
+
+    def save(self, path):
+        np.savez(path, start_tt=self.start_tt, span_days=self.span_days, **self.coefficients)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            return cls(data["start_tt"], data["span_days"], {name: data[name] for name in QUANTITIES})
+
+    def covers(self, tt):
+        tt = np.asarray(tt)
+        return tt.size > 0 and self.start_tt <= tt.min() and tt.max() < self.end_tt
+
+    def _locate(self, tt):
+        offset = (np.asarray(tt, dtype=float) - self.start_tt) / self.span_days
+        segment = np.clip(np.floor(offset).astype(int), 0, self.segments - 1)
+        return segment, 2 * (offset - segment) - 1
+
+    def _clenshaw(self, c, segment, x):
+        b1 = b2 = np.zeros_like(x)
+        for j in range(len(c) - 1, 0, -1):
+            b1, b2 = 2 * x * b1 - b2 + c[j, segment], b1
+        return x * b1 - b2 + c[0, segment]
+
+    def evaluate(self, name, tt):
+        """One quantity in degrees (longitudes in [0, 360)) for TT Julian dates, scalar or array."""
+        segment, x = self._locate(tt)
+        value = self._clenshaw(self.coefficients[name], segment, x)
+        return value % 360 if name.endswith("longitude") else value
+
+    def rate(self, name, tt):
+        """Rate of change of one quantity in degrees per day."""
+        segment, x = self._locate(tt)
+        return self._clenshaw(chebyshev.chebder(self.coefficients[name]), segment, x) * 2 / self.span_days
+
+    def longitudes(self, tt):
+        return self.evaluate("sun_longitude", tt), self.evaluate("moon_longitude", tt)
+
+    def verify(self, samples_per_segment=4, seed=0):
+        """
+        Compares the model with Skyfield at random instants, `samples_per_segment` per segment,
+        and records and returns the largest error of each quantity in degrees.
+        """
+        rng = np.random.default_rng(seed)
+        tt = self.start_tt + self.span_days * (
+            np.repeat(np.arange(self.segments), samples_per_segment) + rng.random(self.segments * samples_per_segment))
+        self.max_error = {}
+        for name, exact in zip(QUANTITIES, apparent_positions(tt)):
+            error = self.evaluate(name, tt) - exact
+            if name.endswith("longitude"):
+                error = (error + 180) % 360 - 180
+            self.max_error[name] = float(np.max(np.abs(error)))
+        return self.max_error
+
+
+def install(model, tolerance=TOLERANCE_DEGREES, verify=True):
+    """
+    Makes the model the fast path if its verified error is within tolerance (degrees).
+    Returns True when installed; otherwise warns and leaves Skyfield in use.
+    """
+    global installed
+    if verify or model.max_error is None:
+        model.verify()
+    worst = max(model.max_error.values())
+    if worst > tolerance:
+        warnings.warn(f"Chebyshev model error {worst:.2e} deg exceeds {tolerance:.2e} deg; using Skyfield")
+        return False
+    installed = model
+    return True
+
+
+def uninstall():
+    global installed
+    installed = None
+
+
+def use_fast_path(start_year, end_year, tolerance=TOLERANCE_DEGREES, **options):
+    """Fits, verifies and installs a model for start_year to end_year; returns it, or None when rejected."""
+    model = ChebyshevModel.fit(start_year, end_year, **options)
+    return model if install(model, tolerance) else None
+
+
+def model_for(tt):
+    """The installed model when it covers every given TT Julian date, else None."""
+    model = installed
+    if model is not None and model.covers(tt):
+        return model
+    return None
+
+
+def refine_roots(times, exact_angle, rate, size, iterations=2):
+    """
+    Newton steps that move roots found on the model onto the nearest multiple of `size`
+    degrees of the exact angle. exact_angle(tt) is the Skyfield value and rate(tt) its
+    rate in degrees per day; all roots are refined together in one call per step.
+    """
+    if not len(times):
+        return times
+    ts = get_timescale()
+    tt = times.tt
+    target = None
+    for _ in range(iterations):
+        angle = exact_angle(tt)
+        if target is None:
+            target = np.round(angle / size) * size
+        tt = tt - ((angle - target + 180) % 360 - 180) / rate(tt)
+    return ts.tt_jd(tt)
@@ -0,0 +1,131 @@
+from datetime import datetime
+import os
+import warnings
+
+from .cache import AlmanacCache, CachedPanchang
+from .festivals import load_festival_rules
+from .panchang import Panchang, DEFAULT_ZONE
+
+# fallback (Agartala if detection fails)
+DEFAULT_LOCATION = (23.8315, 91.2868, "Agartala", "Tripura")
+
+
+def print_banner():
+    import pyfiglet
+
+    banner_text = pyfiglet.figlet_format("Ind-Panchang")
+    print(banner_text, "\n version 2.0 (All Festivals)")
+    print("(50% MY LOGIC <--> 50% PROMPT. ENGG.)")
+    print(
+        """
+**********************************
+* ------------------------------ *
+* |Created by Mr. Susanta Banik| *
+* ------------------------------ *
+**********************************
+"""
+    )
+
+
+def detect_location():
+    """Returns (latitude, longitude, city, state) from IP geolocation, or Agartala on any failure."""
+    try:
+        import geocoder
+
+        g = geocoder.ip("me")  # auto-detect location by IP
+        if g.ok and g.latlng:
+            latitude, longitude = g.latlng
+            city = g.city if g.city else "Unknown City"
+            state = g.state if g.state else "Unknown State"
+            """
+            tf = TimezoneFinder()
+            timezone_str = tf.timezone_at(lng=longitude, lat=latitude)
+            if not timezone_str:
+                timezone_str = "Asia/Kolkata"  # fallback
+            """
+            return latitude, longitude, city, state
+    except Exception:
+        pass
+    return DEFAULT_LOCATION
+
+
+def print_monthly_festivals(panchang, year, month):
+    print(f"\n📅 Festivals for {datetime(year, month, 1).strftime('%B %Y')}:")
+    print("------------------------------------------")
+    found_festivals = panchang.get_monthly_festivals(year, month)
+    if found_festivals:
+        for fest, start_t, end_t in found_festivals:
+            if isinstance(start_t, datetime) and isinstance(end_t, datetime):
+                print(f"🎉 {fest} : from --> {start_t.strftime('%d %b, %I:%M:%S %p')} to {end_t.strftime('%d %b, %I:%M:%S %p')}\n")
+            else:
+                print(f"🎉 {fest}\n")
+    else:
+        print("No major festivals found for this month.")
+    print("------------------------------------------")
+
+
+def print_daily_panchang(panchang, date_input=None):
+    day = panchang.daily_panchang(date_input)
+    dt_local = day["date"]
+    bengali_month, bengali_day, bengali_year = day["bengali_date"]
+    sunrise, sunset = day["sunrise"], day["sunset"]
+    moonrise, moonset = day["moonrise"], day["moonset"]
+    zone_abbr = dt_local.strftime('%Z')
+
+    print(f"\n📅 Daily Panchang for {panchang.name}:")
+    print(f"Today (English): {dt_local.strftime('%A, %d-%m-%Y, %I:%M %p')} {zone_abbr}\n")
+    print(f"------------------------------------------")
+    print(f"Bengali Date: {bengali_month} {bengali_day}, {bengali_year} Bangabda")
+    print(f"Paksha: {day['paksha']} Paksha")
+    print(f"Current Tithi: {day['tithi']}")
+    for tithi in day["tithi_events"]:
+        print(f"  → Tithi {tithi['tithi_num']} ({tithi['paksha']} Paksha) runs from {tithi['start'].strftime('%d %b %I:%M %p')} to {tithi['end'].strftime('%d %b %I:%M %p')}")
+    print(f"------------------------------------------")
+    print(f"Nakshatra: {day['nakshatra']} | Yoga: {day['yoga']} | Karana: {day['karana']}")
+    for kind, spans in day["angular_spans"].items():
+        for span in spans:
+            print(f"  → {kind.title()} {span['name']} runs from {span['start'].strftime('%d %b %I:%M %p')} to {span['end'].strftime('%d %b %I:%M %p')}")
+    print(f"------------------------------------------")
+    print(f"☀️ Sunrise: {sunrise.strftime('%I:%M %p') if sunrise else 'N/A'} | Sunset: {sunset.strftime('%I:%M %p') if sunset else 'N/A'}")
+    print(f"🌕 Moonrise: {moonrise.strftime('%I:%M %p') if moonrise else 'N/A'} | Moonset: {moonset.strftime('%I:%M %p') if moonset else 'N/A'}")
+    print(f"------------------------------------------")
+    print("🎉 Festivals Today:")
+    if day["festivals"]:
+        for fest in day["festivals"]: print(f"  • {fest}")
+    else:
+        print("  No major festival today")
+    print(f"------------------------------------------")
+    print("🌙 Moon Phases Today:")
+    if day["moon_phases"]:
+        for name, when in day["moon_phases"]: print(f"  • {name} at {when.strftime('%I:%M %p')}")
+    else:
+        print("  No major moon phase event today")
+    print(f"------------------------------------------")
+    print("🌑 Eclipses Visible Today:")
+    if day["eclipses"]:
+        for ecl_type, start, max_ecl, end in day["eclipses"]:
+            print(f"  • {ecl_type}: Start: {start.strftime('%I:%M %p')}, Max: {max_ecl.strftime('%I:%M %p')}, End: {end.strftime('%I:%M %p')}")
+    else:
+        print(f"  No eclipse visible from {panchang.name} today")
+    print(f"------------------------------------------")
+
+
+def main():
+    print_banner()
+    warnings.filterwarnings("ignore")
+    latitude, longitude, city, state = detect_location()
+    # extra festival rule files, separated like PATH
+    for rules_file in filter(None, os.environ.get("IND_PANCHANG_FESTIVALS", "").split(os.pathsep)):
+        load_festival_rules(rules_file)
+    cache_dir = os.environ.get("IND_PANCHANG_CACHE")
+    if cache_dir:
+        panchang = CachedPanchang(latitude, longitude, DEFAULT_ZONE, name=f"{city},{state}", cache=AlmanacCache(cache_dir))
+    else:
+        panchang = Panchang(latitude, longitude, DEFAULT_ZONE, name=f"{city},{state}")
+
+    # --- Show Today's Detailed Panchang ---
+    now = panchang.now()
+    print_daily_panchang(panchang, date_input=now)
+
+    # --- Show This Month's Festival List ---
+    print_monthly_festivals(panchang, now.year, now.month)
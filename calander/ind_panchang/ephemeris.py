@@ -0,0 +1,183 @@
+"""
+Skyfield timescale and ephemeris, loaded on first use and shared by every Panchang
+in the process.
+
+Set IND_PANCHANG_EPHEMERIS=/path/to/kernel.bsp (or call use_ephemeris()) to read a
+local file with no download attempt. The tool needs only the sun, earth and moon, so
+a kernel trimmed to those bodies and the years in use loads faster and keeps less in
+memory; make one with
+
+    python -m ind_panchang.ephemeris de421.bsp panchang.bsp 1990 2050
+"""
+import argparse
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+
+from skyfield.api import load, load_file
+
+EPHEMERIS_FILE = "de421.bsp"
+EPHEMERIS_ENV = "IND_PANCHANG_EPHEMERIS"
+# SPK targets whose segments chain each body to the solar system barycentre
+BODY_TARGETS = {"sun": (10,), "earth": (3, 399), "moon": (3, 301)}
+# apparent() bends light around the sun, Jupiter and Saturn, so their barycentres are always kept
+DEFLECTOR_TARGETS = (5, 6, 10)
+# Julian date of the proleptic Gregorian ordinal 0 at midnight
+ORDINAL_TO_JD = 1721424.5
+
+_lock = threading.Lock()
+_timescale = None
+_ephemeris = None
+_path = None  # local file the shared ephemeris came from, if it was loaded with load_file()
+
+
+def get_timescale():
+    global _timescale
+    if _timescale is None:
+        with _lock:
+            if _timescale is None:
+                _timescale = load.timescale()
+    return _timescale
+
+
+def get_ephemeris():
+    global _ephemeris, _path
+    if _ephemeris is None:
+        with _lock:
+            if _ephemeris is None:
+                path = os.environ.get(EPHEMERIS_ENV)
+                if path:
+                    _ephemeris, _path = load_file(path), os.path.abspath(path)
+                else:
+                    _ephemeris = load(EPHEMERIS_FILE)
+    return _ephemeris
+
+
+def use_ephemeris(path):
+    """
+    Loads the ephemeris from a local file, never downloading, and makes it the shared one.
+    Does nothing if that file is already the shared ephemeris.
+    """
+    global _ephemeris, _path
+    path = os.path.abspath(path)
+    with _lock:
+        if _ephemeris is None or _path != path:
+            _ephemeris, _path = load_file(path), path
+        return _ephemeris
+
+
+def ephemeris_path():
+    """The local file behind the shared ephemeris, or None for the default (downloadable) one."""
+    return _path or (os.path.abspath(os.environ[EPHEMERIS_ENV]) if os.environ.get(EPHEMERIS_ENV) else None)
+
+
+def kernel_identity():
+    """
+    [source, center, target, first JD, last JD] of every segment of the shared ephemeris,
+    which tells one kernel, or one trimmed copy of it, from another.
+    """
+    return [
+        [segment.source.decode("ascii", "replace").strip(), segment.center, segment.target, segment.start_jd, segment.end_jd]
+        for segment in get_ephemeris().spk.segments
+    ]
+
+
+def get_bodies():
+    """Returns (earth, sun, moon) from the shared ephemeris."""
+    eph = get_ephemeris()
+    return eph["earth"], eph["sun"], eph["moon"]
+
+
+def preload():
+    """
+    Loads the ephemeris and maps the sun, earth and moon segments now. Call it before
+    starting worker processes: forked workers then share these pages instead of each
+    opening the kernel and copying the segments again.
+    """
+    earth, sun, moon = get_bodies()
+    segments = get_ephemeris().spk.segments
+    middle = (max(s.start_jd for s in segments) + min(s.end_jd for s in segments)) / 2
+    e = earth.at(get_timescale().tdb_jd(middle))
+    e.observe(sun).apparent()
+    e.observe(moon).apparent()
+
+
+def init_worker(path):
+    """Pool initializer: uses the parent's ephemeris file (a no-op in forked workers, which inherit it)."""
+    get_timescale()
+    if path:
+        use_ephemeris(path)
+    else:
+        get_ephemeris()
+
+
+def worker_pool(workers, initializer=init_worker, initargs=()):
+    """
+    A ProcessPoolExecutor whose workers read this process's ephemeris. The ephemeris is
+    preloaded first so forked workers share it; `initializer` is called with `initargs`
+    followed by the ephemeris file, and should pass that file on to init_worker().
+    """
+    preload()
+    return ProcessPoolExecutor(max_workers=workers, initializer=initializer, initargs=(*initargs, ephemeris_path()))
+
+
+# ---------------- SUBSETTING ----------------
+
+def subset_ephemeris(source, output, start_year, end_year, bodies=("earth", "moon", "sun")):
+    """
+    Writes a copy of the SPK kernel `source` holding only the segments the bodies need
+    (plus the light deflectors apparent() uses), cut to January 1 of start_year through the end of end_year (rounded out to whole
+    ephemeris records). Returns the targets written.
+    """
+    from jplephem.excerpter import write_excerpt
+    from jplephem.spk import SPK
+
+    unknown = [body for body in bodies if body not in BODY_TARGETS]
+    if unknown:
+        raise ValueError(f"unknown bodies {', '.join(unknown)}; expected some of {', '.join(BODY_TARGETS)}")
+    if end_year < start_year:
+        raise ValueError("end_year must not be before start_year")
+    targets = sorted({target for body in bodies for target in BODY_TARGETS[body]} | set(DEFLECTOR_TARGETS))
+    start_jd = date(start_year, 1, 1).toordinal() + ORDINAL_TO_JD - 1
+    end_jd = date(end_year + 1, 1, 1).toordinal() + ORDINAL_TO_JD + 1
+    spk = SPK.open(source)
+    try:
+        summaries = [
+            summary for summary, segment in zip(spk.daf.summaries(), spk.segments)
+            if segment.target in targets
+        ]
+        missing = set(targets) - {segment.target for segment in spk.segments}
+        if missing:
+            raise ValueError(f"{source} has no segments for targets {sorted(missing)}")
+        first = max(segment.start_jd for segment in spk.segments if segment.target in targets)
+        last = min(segment.end_jd for segment in spk.segments if segment.target in targets)
+        if start_jd < first or end_jd > last:
+            raise ValueError(f"{source} covers JD {first} to {last}, not {start_year} to {end_year}")
+        with open(output, "w+b") as out:
+            write_excerpt(spk, out, start_jd, end_jd, summaries)
+    finally:
+        spk.close()
+    return targets
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Trim a JPL SPK kernel to the bodies and years the panchang needs.")
+    parser.add_argument("source", help="full kernel, e.g. de421.bsp")
+    parser.add_argument("output", help="kernel to write")
+    parser.add_argument("start_year", type=int)
+    parser.add_argument("end_year", type=int)
+    parser.add_argument("--bodies", default="earth,moon,sun", help="comma-separated, from: " + ", ".join(BODY_TARGETS))
+    args = parser.parse_args(argv)
+
+    try:
+        targets = subset_ephemeris(args.source, args.output, args.start_year, args.end_year, args.bodies.split(","))
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+    size = os.path.getsize(args.output)
+    print(f"{args.output}: targets {', '.join(map(str, targets))}, {args.start_year}-{args.end_year}, {size / 1e6:.1f} MB")
+    print(f"use it with {EPHEMERIS_ENV}={os.path.abspath(args.output)}")
+
+
+if __name__ == "__main__":
+    main()
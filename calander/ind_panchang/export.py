@@ -0,0 +1,191 @@
+"""
+Streaming export of panchang records to CSV, JSON Lines and iCalendar.
+
+    python -m ind_panchang.export festivals 2000 2050 --format ics -o festivals.ics
+    python -m ind_panchang.export days 2025 2025 --format csv -o 2025.csv
+
+Records are produced a month at a time and written as they come, so a 50-year export
+holds one month of results in memory, not fifty years.
+"""
+import argparse
+import csv
+import json
+import sys
+from datetime import date, datetime, timedelta, timezone
+
+from .almanac import iter_almanac
+from .festivals import load_festival_rules
+from .panchang import Panchang, DEFAULT_ZONE
+from .records import DaySheet, Eclipse, Festival, Span
+
+FORMATS = ("csv", "jsonl", "ics")
+RECORD_KINDS = ("days", "festivals", "tithis", "eclipses")
+
+
+# ---------------- RECORD STREAMS ----------------
+
+def iter_festival_records(panchang, start_year, end_year):
+    for entry in iter_almanac(panchang, start_year, end_year):
+        yield Festival.from_tuple(entry)
+
+
+def iter_span_records(panchang, start_year, end_year, kind="tithi"):
+    start = datetime(start_year, 1, 1, tzinfo=panchang.zone)
+    end = datetime(end_year + 1, 1, 1, tzinfo=panchang.zone)
+    for span in panchang.iter_angular_events(kind, start, end):
+        yield Span.from_dict(span)
+
+
+def iter_eclipse_records(panchang, start_year, end_year):
+    start = datetime(start_year, 1, 1, tzinfo=panchang.zone)
+    end = datetime(end_year + 1, 1, 1, tzinfo=panchang.zone)
+    for eclipse in panchang.iter_eclipses(start, end):
+        yield Eclipse.from_dict(eclipse)
+
+
+def iter_day_records(panchang, start_year, end_year):
+    """
+    One DaySheet per local day, taken at sunrise (noon where the sun does not rise).
+    Sunrise and moonrise come from one rise/set table per month, which is dropped from
+    the Panchang once the month has been written.
+    """
+    month = date(start_year, 1, 1)
+    while month.year <= end_year:
+        next_month = (month + timedelta(days=32)).replace(day=1)
+        panchang.get_rise_set_table(month, next_month)
+        day = month
+        while day < next_month:
+            sunrise, _ = panchang.get_sunrise_sunset(day)
+            moment = sunrise or datetime(day.year, day.month, day.day, 12, tzinfo=panchang.zone)
+            yield DaySheet.from_dict(panchang.daily_panchang(moment))
+            panchang.rise_set_days.pop(day.toordinal(), None)
+            day += timedelta(days=1)
+        month = next_month
+
+
+def iter_records(panchang, kind, start_year, end_year):
+    if kind == "days":
+        return iter_day_records(panchang, start_year, end_year)
+    if kind == "festivals":
+        return iter_festival_records(panchang, start_year, end_year)
+    if kind == "tithis":
+        return iter_span_records(panchang, start_year, end_year, "tithi")
+    if kind == "eclipses":
+        return iter_eclipse_records(panchang, start_year, end_year)
+    raise ValueError(f"unknown record kind {kind!r}; expected one of {', '.join(RECORD_KINDS)}")
+
+
+# ---------------- WRITERS ----------------
+
+def write_csv(records, out):
+    """Writes a header from the first record's csv_fields, then one row per record. Returns the row count."""
+    writer = None
+    count = 0
+    for record in records:
+        if writer is None:
+            writer = csv.writer(out)
+            writer.writerow(record.csv_fields)
+        writer.writerow(record.csv_row())
+        count += 1
+    return count
+
+
+def write_jsonl(records, out):
+    count = 0
+    for record in records:
+        out.write(json.dumps(record.as_json(), ensure_ascii=False))
+        out.write("\n")
+        count += 1
+    return count
+
+
+def _ics_escape(text):
+    return text.replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,").replace("\n", "\\n")
+
+
+def _ics_line(out, line):
+    # content lines are folded at 75 octets (RFC 5545 3.1), counting the space that starts a continuation
+    data = line.encode("utf-8")
+    limit = 75
+    while len(data) > limit:
+        cut = limit
+        while (data[cut] & 0xC0) == 0x80:  # do not split a UTF-8 sequence
+            cut -= 1
+        out.write(data[:cut].decode("utf-8") + "\r\n ")
+        data = data[cut:]
+        limit = 74
+    out.write(data.decode("utf-8") + "\r\n")
+
+
+def _ics_time(name, value):
+    if isinstance(value, datetime):
+        return f"{name}:{value.astimezone(timezone.utc):%Y%m%dT%H%M%SZ}"
+    return f"{name};VALUE=DATE:{value:%Y%m%d}"
+
+
+def write_ics(records, out, calendar_name="Ind-Panchang"):
+    """Writes a VCALENDAR with one VEVENT per record. Returns the event count."""
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    for line in ("BEGIN:VCALENDAR", "VERSION:2.0", "PRODID:-//Ind-Panchang//EN", "CALSCALE:GREGORIAN",
+                 f"X-WR-CALNAME:{_ics_escape(calendar_name)}"):
+        _ics_line(out, line)
+    count = 0
+    for record in records:
+        uid, summary, start, end, description = record.ics_event()
+        if end is None and not isinstance(start, datetime):
+            end = start + timedelta(days=1)
+        _ics_line(out, "BEGIN:VEVENT")
+        _ics_line(out, f"UID:{uid}@ind-panchang")
+        _ics_line(out, f"DTSTAMP:{stamp}")
+        _ics_line(out, _ics_time("DTSTART", start))
+        if end is not None:
+            _ics_line(out, _ics_time("DTEND", end))
+        _ics_line(out, f"SUMMARY:{_ics_escape(summary)}")
+        if description:
+            _ics_line(out, f"DESCRIPTION:{_ics_escape(description)}")
+        _ics_line(out, "END:VEVENT")
+        count += 1
+    _ics_line(out, "END:VCALENDAR")
+    return count
+
+
+def export(records, out, fmt):
+    if fmt == "csv":
+        return write_csv(records, out)
+    if fmt == "jsonl":
+        return write_jsonl(records, out)
+    if fmt == "ics":
+        return write_ics(records, out)
+    raise ValueError(f"unknown format {fmt!r}; expected one of {', '.join(FORMATS)}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export panchang records for a range of years.")
+    parser.add_argument("kind", choices=RECORD_KINDS)
+    parser.add_argument("start_year", type=int)
+    parser.add_argument("end_year", type=int)
+    parser.add_argument("--format", choices=FORMATS, default="csv")
+    parser.add_argument("-o", "--output", help="file to write (default: standard output)")
+    parser.add_argument("--latitude", type=float, default=23.8315)
+    parser.add_argument("--longitude", type=float, default=91.2868)
+    parser.add_argument("--zone", default=DEFAULT_ZONE)
+    parser.add_argument("--rules", action="append", default=[], help="extra festival rule file (JSON), may be repeated")
+    args = parser.parse_args(argv)
+
+    for rules_file in args.rules:
+        load_festival_rules(rules_file)
+    panchang = Panchang(args.latitude, args.longitude, args.zone)
+    records = iter_records(panchang, args.kind, args.start_year, args.end_year)
+    # csv and iCalendar manage their own line endings
+    newline = "" if args.format in ("csv", "ics") else None
+    if args.output:
+        with open(args.output, "w", encoding="utf-8", newline=newline) as out:
+            count = export(records, out, args.format)
+    else:
+        sys.stdout.reconfigure(newline=newline)
+        count = export(records, sys.stdout, args.format)
+    print(f"{count} {args.kind} written", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
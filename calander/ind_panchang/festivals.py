@@ -0,0 +1,198 @@
+"""
+Festival rules as data.
+
+Each rule is a dict naming a festival and exactly one way of finding it:
+  - a lunar date: "lunar_month", "paksha", "tithi" (1-15, 15 is the purnima/amavasya),
+    optionally "nakshatra", and "observance" which is "tithi" (the festival falls on the
+    tithi itself) or "sunrise" (it is kept on the day whose sunrise the tithi covers);
+  - "solar_date": "MM-DD" or a list of them (Gregorian);
+  - "hijri_date": "MM-DD" or a list of them.
+
+Rules are compiled into dicts keyed by (lunar_month, paksha, tithi), (month, day) and
+(hijri month, hijri day), so a lookup costs the same however many rules are loaded.
+Extra rule sets can be loaded from JSON files holding a list of rules.
+"""
+import json
+import os
+from datetime import date
+
+from .hijri import HijriTable, hijri_date
+from .names import lunar_months, nakshatras
+
+OBSERVANCES = ("tithi", "sunrise")
+RULES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "rules")
+
+BUILTIN_RULES = [
+    # Tithi-based festivals
+    {"name": "Ram Navami", "lunar_month": "Chaitra", "paksha": "Shukla", "tithi": 9},
+    {"name": "Buddha Purnima", "lunar_month": "Vaishakha", "paksha": "Shukla", "tithi": 15},
+    {"name": "Guru Purnima", "lunar_month": "Ashadha", "paksha": "Shukla", "tithi": 15, "nakshatra": "Punarvasu"},
+    {"name": "Raksha Bandhan", "lunar_month": "Shravana", "paksha": "Shukla", "tithi": 15},
+    {"name": "Janmashtami", "lunar_month": "Shravana", "paksha": "Krishna", "tithi": 8},
+    {"name": "Ganesh Chaturthi", "lunar_month": "Bhadrapada", "paksha": "Shukla", "tithi": 4},
+    {"name": "Vishwakarma Puja", "lunar_month": "Bhadrapada", "paksha": "Krishna", "tithi": 11},
+    {"name": "Mahalaya", "lunar_month": "Ashwin", "paksha": "Krishna", "tithi": 15},
+    {"name": "Durga Puja (Begains)", "lunar_month": "Ashwin", "paksha": "Shukla", "tithi": 4},
+    {"name": "Durga Puja (Panchami)", "lunar_month": "Ashwin", "paksha": "Shukla", "tithi": 5},
+    {"name": "Durga Puja (Sosthi)", "lunar_month": "Ashwin", "paksha": "Shukla", "tithi": 6},
+    {"name": "Durga Puja (Saptami)", "lunar_month": "Ashwin", "paksha": "Shukla", "tithi": 7},
+    {"name": "Durga Puja (Astami)", "lunar_month": "Ashwin", "paksha": "Shukla", "tithi": 8},
+    {"name": "Durga Puja (Navami)", "lunar_month": "Ashwin", "paksha": "Shukla", "tithi": 9},
+    {"name": "Dussehra / Vijaya Dashami", "lunar_month": "Ashwin", "paksha": "Shukla", "tithi": 10},
+    {"name": "Chhoti Diwali / Naraka Chaturdashi", "lunar_month": "Kartika", "paksha": "Krishna", "tithi": 14},
+    {"name": "Diwali", "lunar_month": "Kartika", "paksha": "Krishna", "tithi": 15},
+    {"name": "Maha Shivaratri", "lunar_month": "Magha", "paksha": "Krishna", "tithi": 14},
+    {"name": "Holika Dahan", "lunar_month": "Phalguna", "paksha": "Krishna", "tithi": 15},
+    {"name": "Holi", "lunar_month": "Phalguna", "paksha": "Shukla", "tithi": 1},
+    # Date-based festivals
+    {"name": "Makar Sankranti / Pongal", "solar_date": "01-14"},
+    {"name": "Ugadi / Gudi Padwa", "solar_date": ["03-22", "03-23"]},
+    {"name": "Pohela Boishakh / Baisakhi / Vishu / Tamil New Year", "solar_date": "04-14"},
+    {"name": "Onam", "solar_date": ["08-28", "08-29"]},
+    {"name": "Christmas", "solar_date": "12-25"},
+    {"name": "Gregorian New Year", "solar_date": "01-01"},
+    {"name": "Vaisakhi", "solar_date": "04-14"},
+    {"name": "Guru Nanak Jayanti", "solar_date": "11-24"},
+    # Hijri festivals
+    {"name": "Eid ul-Fitr", "hijri_date": "10-01"},
+    {"name": "Eid ul-Adha", "hijri_date": "12-10"},
+    {"name": "Islamic New Year", "hijri_date": "01-01"},
+]
+
+
+def month_days(value, field):
+    values = [value] if isinstance(value, str) else list(value)
+    try:
+        return [tuple(int(part) for part in v.split("-")) for v in values]
+    except (AttributeError, ValueError):
+        raise ValueError(f"{field} must be 'MM-DD' or a list of them, got {value!r}")
+
+
+def hijri_month_day(dt):
+    """(month, day) of the Hijri date for a Gregorian date, or None outside the supported range."""
+    hijri = hijri_date(dt)
+    return None if hijri is None else hijri[1:]
+
+
+def gregorian_dates_for_hijri(month, day, start_date, end_date):
+    """Gregorian dates in [start_date, end_date] that fall on Hijri (month, day)."""
+    return HijriTable(start_date, end_date).dates_for(month, day)
+
+
+class FestivalRegistry:
+    """Festival rules compiled into hash indexes."""
+
+    def __init__(self, rules=()):
+        self.rules = []
+        self.rule_keys = set()  # canonical JSON of each rule, so loading a file twice adds nothing
+        self.tithi_rules = {}  # (lunar_month, paksha, tithi) -> [rule, ...] in the order added
+        self.solar_rules = {}  # (month, day) -> [name, ...]
+        self.hijri_rules = {}  # (hijri month, hijri day) -> [name, ...]
+        self.observances = set()  # observances used by at least one tithi rule
+        self.by_name = {}  # name -> [rule, ...], for finding a festival's dates
+        for rule in rules:
+            self.add(rule)
+
+    def __len__(self):
+        return len(self.rules)
+
+    def add(self, rule):
+        """Validates a rule and adds it to the indexes. Adding the same rule twice has no effect."""
+        if "name" not in rule:
+            raise ValueError(f"festival rule without a name: {rule!r}")
+        kinds = [k for k in ("tithi", "solar_date", "hijri_date") if k in rule]
+        if len(kinds) != 1:
+            raise ValueError(f"festival rule {rule['name']!r} needs exactly one of tithi, solar_date or hijri_date")
+        if kinds[0] == "tithi":
+            rule = dict(rule, observance=rule.get("observance", "tithi"))
+        rule_key = json.dumps(rule, sort_keys=True)
+        if rule_key in self.rule_keys:
+            return
+        name = rule["name"]
+
+        if kinds[0] == "tithi":
+            observance = rule["observance"]
+            if rule.get("lunar_month") not in lunar_months:
+                raise ValueError(f"festival rule {name!r} has unknown lunar_month {rule.get('lunar_month')!r}")
+            if rule.get("paksha") not in ("Shukla", "Krishna"):
+                raise ValueError(f"festival rule {name!r} has unknown paksha {rule.get('paksha')!r}")
+            if not isinstance(rule["tithi"], int) or not 1 <= rule["tithi"] <= 15:
+                raise ValueError(f"festival rule {name!r} needs a tithi from 1 to 15")
+            if "nakshatra" in rule and rule["nakshatra"] not in nakshatras:
+                raise ValueError(f"festival rule {name!r} has unknown nakshatra {rule['nakshatra']!r}")
+            if observance not in OBSERVANCES:
+                raise ValueError(f"festival rule {name!r} has unknown observance {observance!r}")
+            key = (rule["lunar_month"], rule["paksha"], rule["tithi"])
+            self.tithi_rules.setdefault(key, []).append(rule)
+            self.observances.add(observance)
+        else:
+            index = self.solar_rules if kinds[0] == "solar_date" else self.hijri_rules
+            for month_day in month_days(rule[kinds[0]], kinds[0]):
+                index.setdefault(month_day, []).append(name)
+        self.rules.append(rule)
+        self.rule_keys.add(rule_key)
+        self.by_name.setdefault(name, []).append(rule)
+
+    def load(self, path):
+        """Adds every rule in a JSON file holding a list of rules. Returns the number of rules read."""
+        with open(path, encoding="utf-8") as f:
+            rules = json.load(f)
+        if not isinstance(rules, list):
+            raise ValueError(f"{path}: expected a JSON list of festival rules")
+        for rule in rules:
+            self.add(rule)
+        return len(rules)
+
+    def rules_named(self, query):
+        """
+        Rules for the festival called `query` (ignoring case), or for every festival whose
+        name contains it when no name matches exactly.
+        """
+        query = query.strip().lower()
+        exact = [name for name in self.by_name if name.lower() == query]
+        names = exact or [name for name in self.by_name if query in name.lower()]
+        return [rule for name in names for rule in self.by_name[name]]
+
+    def tithi_festivals(self, lunar_month, paksha, tithi_num, nakshatra=None, observance="tithi"):
+        return [
+            rule["name"] for rule in self.tithi_rules.get((lunar_month, paksha, tithi_num), ())
+            if rule["observance"] == observance and rule.get("nakshatra", nakshatra) == nakshatra
+        ]
+
+    def festivals_by_date(self, start_date, end_date):
+        """
+        Gregorian and Hijri date festivals of every date from start_date to end_date inclusive,
+        as {date: [name, ...]}, with the Hijri dates of the whole range taken from one table.
+        """
+        by_date = {}
+        for (month, day), names in self.solar_rules.items():
+            for year in range(start_date.year, end_date.year + 1):
+                try:
+                    when = date(year, month, day)
+                except ValueError:
+                    continue  # 29 February outside leap years
+                if start_date <= when <= end_date:
+                    by_date.setdefault(when, []).extend(names)
+        if self.hijri_rules:
+            table = HijriTable(start_date, end_date)
+            for (month, day), names in self.hijri_rules.items():
+                for when in table.dates_for(month, day):
+                    by_date.setdefault(when, []).extend(names)
+        return by_date
+
+    def date_festivals(self, dt):
+        """Gregorian and Hijri date festivals for the date of dt."""
+        festivals = list(self.solar_rules.get((dt.month, dt.day), ()))
+        if self.hijri_rules:
+            hijri = hijri_month_day(dt)
+            if hijri is not None:
+                festivals.extend(self.hijri_rules.get(hijri, ()))
+        return festivals
+
+
+festival_registry = FestivalRegistry(BUILTIN_RULES)
+
+
+def load_festival_rules(path):
+    """Adds the rules in a JSON file to the registry every Panchang uses."""
+    return festival_registry.load(path)
@@ -0,0 +1,92 @@
+"""
+Hijri (Umm al-Qura) dates for whole ranges of days.
+
+hijridate converts one date at a time by bisecting its table of month starts. Here the
+month starts covering a span are looked up once and every day of the span gets its
+Hijri year, month and day in a few array operations, so converting a date is an array
+index and finding the Gregorian dates of a Hijri (month, day) is one comparison.
+"""
+import threading
+from datetime import date
+
+import numpy as np
+from hijridate import ummalqura
+
+# hijridate keeps month starts as reduced Julian days; this shifts them to date ordinals
+RJD_TO_ORDINAL = 2400000 - 1721425
+# the last entry is the start of the month after the last supported one
+MONTH_STARTS = np.asarray(ummalqura.MONTH_STARTS, dtype=np.int64) + RJD_TO_ORDINAL
+FIRST_DATE = date.fromordinal(int(MONTH_STARTS[0]))
+LAST_DATE = date.fromordinal(int(MONTH_STARTS[-1]) - 1)
+
+_lock = threading.Lock()
+_full_table = None
+
+
+def month_starts(start_date, end_date):
+    """(Gregorian date, Hijri year, Hijri month) of each Hijri month beginning in [start_date, end_date]."""
+    lo = np.searchsorted(MONTH_STARTS[:-1], start_date.toordinal())
+    hi = np.searchsorted(MONTH_STARTS[:-1], end_date.toordinal(), side="right")
+    months = np.arange(lo, hi) + ummalqura.HIJRI_OFFSET
+    return [
+        (date.fromordinal(int(MONTH_STARTS[i])), int(m // 12 + 1), int(m % 12 + 1))
+        for i, m in zip(range(lo, hi), months)
+    ]
+
+
+class HijriTable:
+    """
+    Hijri year, month and day of every Gregorian date from start_date to end_date inclusive,
+    as arrays indexed by day. Days outside hijridate's supported range hold zeros.
+    """
+
+    def __init__(self, start_date, end_date):
+        if end_date < start_date:
+            raise ValueError("end_date must not be before start_date")
+        self.start_date, self.end_date = start_date, end_date
+        self.first = start_date.toordinal()
+        ordinals = np.arange(self.first, end_date.toordinal() + 1)
+        index = np.searchsorted(MONTH_STARTS, ordinals, side="right") - 1
+        valid = (index >= 0) & (index < len(MONTH_STARTS) - 1)
+        index = np.clip(index, 0, len(MONTH_STARTS) - 2)
+        months = index + ummalqura.HIJRI_OFFSET
+        self.year = np.where(valid, months // 12 + 1, 0).astype(np.int16)
+        self.month = np.where(valid, months % 12 + 1, 0).astype(np.int8)
+        self.day = np.where(valid, ordinals - MONTH_STARTS[index] + 1, 0).astype(np.int8)
+
+    def __len__(self):
+        return len(self.day)
+
+    def covers(self, day):
+        return 0 <= day.toordinal() - self.first < len(self.day)
+
+    def hijri_date(self, day):
+        """(year, month, day) in the Hijri calendar for a date or datetime, or None outside hijridate's range."""
+        if not self.covers(day):
+            raise ValueError(f"{day} is outside the table ({self.start_date} to {self.end_date})")
+        i = day.toordinal() - self.first
+        if not self.day[i]:
+            return None
+        return int(self.year[i]), int(self.month[i]), int(self.day[i])
+
+    def dates_for(self, month, day):
+        """Every Gregorian date in the table that falls on Hijri (month, day), in order."""
+        matches = np.nonzero((self.month == month) & (self.day == day))[0]
+        return [date.fromordinal(self.first + int(i)) for i in matches]
+
+
+def full_table():
+    """A HijriTable over every date hijridate supports, built on first use and shared."""
+    global _full_table
+    if _full_table is None:
+        with _lock:
+            if _full_table is None:
+                _full_table = HijriTable(FIRST_DATE, LAST_DATE)
+    return _full_table
+
+
+def hijri_date(day):
+    """(year, month, day) in the Hijri calendar for a Gregorian date, or None outside hijridate's range."""
+    if not FIRST_DATE.toordinal() <= day.toordinal() <= LAST_DATE.toordinal():
+        return None
+    return full_table().hijri_date(day)
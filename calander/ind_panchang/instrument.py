@@ -0,0 +1,213 @@
+"""
+Opt-in timers and counters for the hot paths.
+
+    IND_PANCHANG_STATS=1 python -m ind_panchang            # report on stderr at exit
+    IND_PANCHANG_STATS=stats.json python -m ind_panchang   # JSON report written at exit
+
+or, from code:
+
+    with instrument.instrumented() as stats:
+        panchang.daily_panchang(moment)
+    print(stats.report())
+
+Each stage records its calls and wall time together with the ephemeris observations,
+root searches, search iterations (step-function calls) and time samples made inside it,
+so a slow call shows where its time went. Nested stages include their children.
+While instrumentation is off, every hook costs one flag test.
+"""
+import atexit
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from functools import wraps
+
+from skyfield.almanac import find_discrete as _find_discrete
+from skyfield.searchlib import find_minima as _find_minima
+
+STATS_ENV = "IND_PANCHANG_STATS"
+COUNTERS = ("observations", "searches", "iterations", "samples")
+
+_setting = os.environ.get(STATS_ENV, "")
+enabled = _setting not in ("", "0")
+
+_lock = threading.Lock()
+_local = threading.local()
+_thread_counters = []  # one counter dict per thread that has counted anything
+_stages = {}  # stage name -> {"calls", "seconds", "max_seconds", counter totals...}
+_NOOP = nullcontext()
+
+
+def _counters():
+    counters = getattr(_local, "counters", None)
+    if counters is None:
+        counters = _local.counters = dict.fromkeys(COUNTERS, 0)
+        with _lock:
+            _thread_counters.append(counters)
+    return counters
+
+
+def count(name, n=1):
+    """Adds n to one of COUNTERS for the current thread."""
+    if enabled:
+        _counters()[name] += n
+
+
+def observed(t, bodies=1):
+    """Counts the observations of `bodies` bodies at every instant of a Skyfield Time."""
+    if enabled:
+        _counters()["observations"] += bodies * t.tt.size
+
+
+class _Stage:
+    __slots__ = ("name", "started", "before")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.before = dict(_counters())
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self.started
+        counters = _counters()
+        with _lock:
+            entry = _stages.get(self.name)
+            if entry is None:
+                entry = _stages[self.name] = dict(dict.fromkeys(COUNTERS, 0), calls=0, seconds=0.0, max_seconds=0.0)
+            entry["calls"] += 1
+            entry["seconds"] += elapsed
+            entry["max_seconds"] = max(entry["max_seconds"], elapsed)
+            for name in COUNTERS:
+                entry[name] += counters[name] - self.before[name]
+        return False
+
+
+def stage(name):
+    """Context manager timing a named stage; a shared no-op while instrumentation is off."""
+    return _Stage(name) if enabled else _NOOP
+
+
+def timed(name=None):
+    """Decorator recording every call of a function as a stage (the function's qualified name by default)."""
+    def decorate(fn):
+        label = name or fn.__qualname__
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not enabled:
+                return fn(*args, **kwargs)
+            with _Stage(label):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def _counting(f):
+    def step(t):
+        counters = _counters()
+        counters["iterations"] += 1
+        counters["samples"] += t.tt.size
+        return f(t)
+    step.__dict__.update(f.__dict__)  # step_days / rough_period
+    return step
+
+
+def find_discrete(start_time, end_time, f, **options):
+    """skyfield.almanac.find_discrete(), counting the search, its iterations and samples when enabled."""
+    if not enabled:
+        return _find_discrete(start_time, end_time, f, **options)
+    count("searches")
+    return _find_discrete(start_time, end_time, _counting(f), **options)
+
+
+def find_minima(start_time, end_time, f, **options):
+    """skyfield.searchlib.find_minima(), counted like find_discrete()."""
+    if not enabled:
+        return _find_minima(start_time, end_time, f, **options)
+    count("searches")
+    return _find_minima(start_time, end_time, _counting(f), **options)
+
+
+# ---------------- REPORTS ----------------
+
+class Stats:
+    """Read access to what has been collected so far, across all threads."""
+
+    def totals(self):
+        with _lock:
+            return {name: sum(c[name] for c in _thread_counters) for name in COUNTERS}
+
+    def stages(self):
+        with _lock:
+            return {name: dict(entry) for name, entry in _stages.items()}
+
+    def as_dict(self):
+        return {"totals": self.totals(), "stages": self.stages()}
+
+    def report(self):
+        """A text table of the stages, slowest in total first, with per-call means."""
+        stages = sorted(self.stages().items(), key=lambda item: item[1]["seconds"], reverse=True)
+        width = max([len(name) for name, _ in stages] + [5])
+        lines = [
+            f"{'stage':<{width}} {'calls':>7} {'total s':>9} {'mean ms':>9} {'max ms':>9}"
+            f" {'obs/call':>9} {'search/call':>11} {'iter/call':>9} {'samp/call':>9}"
+        ]
+        for name, s in stages:
+            calls = s["calls"]
+            lines.append(
+                f"{name:<{width}} {calls:>7} {s['seconds']:>9.3f} {1000 * s['seconds'] / calls:>9.2f} {1000 * s['max_seconds']:>9.2f}"
+                f" {s['observations'] / calls:>9.0f} {s['searches'] / calls:>11.1f} {s['iterations'] / calls:>9.1f} {s['samples'] / calls:>9.0f}"
+            )
+        totals = self.totals()
+        lines.append("totals: " + ", ".join(f"{name} {totals[name]}" for name in COUNTERS))
+        return "\n".join(lines)
+
+    def dump(self, path=None):
+        """Writes the JSON report to a file, or the text report to stderr without a path."""
+        if path is None:
+            print(self.report(), file=sys.stderr)
+            return
+        with open(path, "w", encoding="utf-8") as out:
+            json.dump(self.as_dict(), out, indent=2)
+
+
+stats = Stats()
+
+
+def reset():
+    with _lock:
+        _stages.clear()
+        for counters in _thread_counters:
+            for name in COUNTERS:
+                counters[name] = 0
+
+
+def enable(on=True):
+    global enabled
+    enabled = bool(on)
+
+
+@contextmanager
+def instrumented(fresh=True):
+    """Turns instrumentation on for the block, optionally from zero, and yields the Stats."""
+    previous = enabled
+    if fresh:
+        reset()
+    enable(True)
+    try:
+        yield stats
+    finally:
+        enable(previous)
+
+
+def _dump_at_exit():
+    stats.dump(None if _setting in ("1", "true", "yes", "stderr") else _setting)
+
+
+if enabled:
+    atexit.register(_dump_at_exit)
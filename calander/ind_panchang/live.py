@@ -0,0 +1,214 @@
+"""
+Live panchang: what is in force now, updated only when something changes.
+
+    live = LivePanchang(Panchang(22.57, 88.36))
+    live.current_at()["tithi"]               # the tithi in force now
+    live.on_transition(notify, kinds=("tithi", "sun"))
+    live.run()                               # sleeps until each transition, then calls notify
+
+    python -m ind_panchang.live --latitude 22.57 --longitude 88.36
+
+The tithi, nakshatra, yoga and karana, day/night (sunrise to sunset) and the moon's
+phase are tracked as spans. The spans of the next `horizon` are computed in one search
+per kind and the start of each kind's next span sits in a heap, so finding what changes
+next is a peek and a transition costs a heap push. Between transitions, reading the
+current state is a heap peek and a dict lookup.
+"""
+import argparse
+import heapq
+import itertools
+import threading
+from collections import deque
+from datetime import timedelta
+
+import numpy as np
+from skyfield.almanac import moon_phases
+
+from .ephemeris import get_bodies
+from .instrument import find_discrete
+from .names import PHASE_NAMES
+from .panchang import ANGULAR_EVENTS, Panchang, DEFAULT_ZONE, to_utc
+
+LIVE_KINDS = tuple(ANGULAR_EVENTS) + ("sun", "moon_phase")
+# the same transition found by two searches differs by far less than this
+SAME_TRANSITION = timedelta(seconds=1)
+# principal moon phases are under 8 days apart
+PHASE_LOOKBACK = timedelta(days=8)
+# give up looking for the next sunrise or sunset (polar day or night) after this long
+MAX_SEARCH = timedelta(days=400)
+
+
+class LivePanchang:
+    """
+    Current spans of one place, advanced transition by transition.
+    `current` maps each kind to the span dict (kind, name, start, end) in force as of the
+    last advance(), or None where there is none (no sunrise or sunset near the poles).
+    It is only up to date while run() is advancing it, or right after advance();
+    current_at() applies any transitions due first, so it is always up to date.
+    """
+
+    def __init__(self, panchang, kinds=LIVE_KINDS, horizon=timedelta(days=2), now=None):
+        unknown = [kind for kind in kinds if kind not in LIVE_KINDS]
+        if unknown:
+            raise ValueError(f"unknown kinds {', '.join(unknown)}; expected some of {', '.join(LIVE_KINDS)}")
+        self.panchang = panchang
+        self.horizon = horizon
+        self.current = {}  # kind -> span in force
+        self.upcoming = {}  # kind -> deque of the spans that follow it, in order
+        self.queue = []  # heap of (start of the kind's next span, sequence, kind)
+        self.listeners = []  # (set of kinds or None for all, callback)
+        self.lock = threading.RLock()
+        self._sequence = itertools.count()
+        self.clock = now or panchang.now()
+        for kind in kinds:
+            spans = self._spans(kind, self.clock, self.clock + horizon)
+            self.current[kind] = next((s for s in spans if s["start"] <= self.clock < s["end"]), None)
+            self.upcoming[kind] = deque(s for s in spans if s["start"] > self.clock)
+            self._schedule(kind)
+
+    # ---------------- SPANS ----------------
+
+    def _spans(self, kind, start, end):
+        """Spans of one kind overlapping [start, end), in order."""
+        if kind in ANGULAR_EVENTS:
+            return self.panchang.get_angular_events(kind, start, end)
+        if kind == "sun":
+            events = self._sun_events(start, end)
+        else:
+            events = self._phase_events(start, end)
+        spans = []
+        for (when, name, index), (next_when, _, _) in zip(events, events[1:]):
+            if when < end and next_when > start:
+                spans.append({"kind": kind, "index": index, "name": name, "start": when, "end": next_when})
+        return spans
+
+    def _sun_events(self, start, end):
+        # searched straight into local arrays: the Panchang's rise/set memo, which may be
+        # shared with other callers, is neither filled nor emptied here
+        p = self.panchang
+        first = p.to_local(start).date() - timedelta(days=1)
+        day_count = (p.to_local(end).date() + timedelta(days=2) - first).days
+        rises, sets = p._rise_set_columns(get_bodies()[1], p.day_bounds(first)[0], day_count)
+        events = [
+            (p._from_timestamp(seconds), name, index)
+            for column, name, index in ((rises, "Day", 1), (sets, "Night", 0))
+            for seconds in column[~np.isnan(column)]
+        ]
+        return sorted(events)
+
+    def _phase_events(self, start, end):
+        p = self.panchang
+        t0 = p.ts.from_datetime(to_utc(start - PHASE_LOOKBACK))
+        t1 = p.ts.from_datetime(to_utc(end + PHASE_LOOKBACK))
+        times, phases = find_discrete(t0, t1, moon_phases(p.eph))
+        return [(p.to_local(when), PHASE_NAMES[int(e)], int(e)) for when, e in zip(times.utc_datetime(), phases)]
+
+    def _extend(self, kind):
+        """Appends the spans of the next horizon after the last one known; False when none are found."""
+        queue = self.upcoming[kind]
+        last = queue[-1] if queue else self.current[kind]
+        start = last["end"] if last else self.clock
+        window = self.horizon
+        while window <= MAX_SEARCH:
+            spans = [s for s in self._spans(kind, start, start + window) if s["end"] > start + SAME_TRANSITION]
+            if spans:
+                queue.extend(spans)
+                return True
+            window *= 2
+        return False
+
+    def _schedule(self, kind):
+        if not self.upcoming[kind] and not self._extend(kind):
+            return
+        heapq.heappush(self.queue, (self.upcoming[kind][0]["start"], next(self._sequence), kind))
+
+    # ---------------- TRANSITIONS ----------------
+
+    def on_transition(self, callback, kinds=None):
+        """Calls callback(kind, span, previous) at every transition of the given kinds (all by default)."""
+        with self.lock:
+            self.listeners.append((set(kinds) if kinds else None, callback))
+
+    def next_transition(self):
+        """(time, kind) of the next transition, or None when nothing is scheduled."""
+        with self.lock:
+            return (self.queue[0][0], self.queue[0][2]) if self.queue else None
+
+    def advance(self, now=None):
+        """
+        Applies every transition up to `now` (the current time by default) in time order,
+        calling the listeners for each. Returns the (kind, span, previous) transitions applied.
+        """
+        now = now or self.panchang.now()
+        applied = []
+        with self.lock:
+            while self.queue and self.queue[0][0] <= now:
+                _, _, kind = heapq.heappop(self.queue)
+                span = self.upcoming[kind].popleft()
+                previous, self.current[kind] = self.current[kind], span
+                self._schedule(kind)
+                applied.append((kind, span, previous))
+            self.clock = max(self.clock, now)
+            listeners = list(self.listeners)
+        for kind, span, previous in applied:
+            for kinds, callback in listeners:
+                if kinds is None or kind in kinds:
+                    callback(kind, span, previous)
+        return applied
+
+    def current_at(self, now=None):
+        """
+        The spans in force at `now` (the current time by default) by kind, after applying
+        the transitions due by then. Raises ValueError for a time before the last advance.
+        """
+        if now is not None and now < self.clock:
+            raise ValueError(f"{now} is before the last advance at {self.clock}")
+        self.advance(now)
+        with self.lock:
+            return dict(self.current)
+
+    def snapshot(self):
+        """The name of what is in force for every kind, as of the last advance()."""
+        with self.lock:
+            return {kind: span["name"] if span else None for kind, span in self.current.items()}
+
+    def run(self, stop=None):
+        """
+        Sleeps until each transition and applies it, until `stop` (a threading.Event) is set.
+        Nothing runs between transitions.
+        """
+        stop = stop or threading.Event()
+        while not stop.is_set():
+            upcoming = self.next_transition()
+            if upcoming is None:
+                return
+            delay = (upcoming[0] - self.panchang.now()).total_seconds()
+            if delay > 0 and stop.wait(delay):
+                return
+            self.advance()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Print each panchang transition as it happens.")
+    parser.add_argument("--latitude", type=float, default=23.8315)
+    parser.add_argument("--longitude", type=float, default=91.2868)
+    parser.add_argument("--zone", default=DEFAULT_ZONE)
+    parser.add_argument("--kinds", default=",".join(LIVE_KINDS), help="comma-separated, from: " + ", ".join(LIVE_KINDS))
+    args = parser.parse_args(argv)
+
+    live = LivePanchang(Panchang(args.latitude, args.longitude, args.zone), kinds=args.kinds.split(","))
+    for kind, span in live.current.items():
+        if span:
+            print(f"{kind:<10} {span['name']:<24} since {span['start']:%Y-%m-%d %H:%M:%S}, until {span['end']:%Y-%m-%d %H:%M:%S}", flush=True)
+
+    def report(kind, span, previous):
+        print(f"{span['start']:%Y-%m-%d %H:%M:%S} {kind:<10} {span['name']:<24} until {span['end']:%Y-%m-%d %H:%M:%S}", flush=True)
+    live.on_transition(report)
+    try:
+        live.run()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+"""Names of the Bengali and lunar months, nakshatras, yogas, karanas and moon phases."""
+
+bengali_months = [
+    "Boishakh", "Jyoishtho", "Asharh", "Shraban", "Bhadro", "Ashwin",
+    "Kartik", "Ogrohayon", "Poush", "Magh", "Falgun", "Chaitra"
+]
+
+lunar_months = [
+    "Vaishakha", "Jyeshtha", "Ashadha", "Shravana", "Bhadrapada", "Ashwin",
+    "Kartika", "Margashirsha", "Pausha", "Magha", "Phalguna", "Chaitra"
+]
+
+nakshatras = [
+    "Ashwini", "Bharani", "Krittika", "Rohini", "Mrigashirsha", "Ardra", "Punarvasu", "Pushya", "Ashlesha",
+    "Magha", "Purva Phalguni", "Uttara Phalguni", "Hasta", "Chitra", "Swati", "Vishakha", "Anuradha",
+    "Jyeshtha", "Mula", "Purva Ashadha", "Uttara Ashadha", "Shravana", "Dhanishta", "Shatabhisha",
+    "Purva Bhadrapada", "Uttara Bhadrapada", "Revati"
+]
+
+yogas = [
+    "Vishkambha", "Priti", "Ayushman", "Saubhagya", "Shobhana", "Atiganda", "Sukarman", "Dhriti", "Shula",
+    "Ganda", "Vriddhi", "Dhruva", "Vyaghata", "Harshana", "Vajra", "Siddhi", "Vyatipata", "Variyana",
+    "Parigha", "Shiva", "Siddha", "Sadhya", "Shubha", "Shukla", "Brahma", "Indra", "Vaidhriti"
+]
+
+karanas = ["Bava", "Balava", "Kaulava", "Taitila", "Garaja", "Vanija", "Vishti"]
+fixed_karanas = ["Kimstughna", "Shakuni", "Chatushpada", "Naga"]
+
+# indexed by skyfield.almanac.moon_phases()
+PHASE_NAMES = {0: "New Moon", 1: "First Quarter", 2: "Full Moon", 3: "Last Quarter"}
@@ -0,0 +1,894 @@
+import threading
+from bisect import bisect_right
+from datetime import date, datetime, timedelta
+from zoneinfo import ZoneInfo
+
+import numpy as np
+from skyfield.api import wgs84
+from skyfield.almanac import risings_and_settings, moon_phases
+
+from . import chebyshev
+from .ephemeris import get_timescale, get_ephemeris, get_bodies
+from .festivals import festival_registry, gregorian_dates_for_hijri, month_days
+from .instrument import find_discrete, find_minima, observed, stage, timed
+from .names import PHASE_NAMES, bengali_months, lunar_months, nakshatras, yogas, karanas, fixed_karanas
+
+DEFAULT_ZONE = "Asia/Kolkata"
+AYANAMSHA = 24.25
+
+# day ordinal plus UTC timestamps of each rise and set, NaN when the body does not rise or set that day
+RISESET_DTYPE = np.dtype([
+    ("day", "<i4"), ("sunrise", "<f8"), ("sunset", "<f8"), ("moonrise", "<f8"), ("moonset", "<f8"),
+])
+
+# ---------------- HELPERS ----------------
+
+def to_utc(dt):
+    return dt.astimezone(ZoneInfo("UTC"))
+
+def normalize_angle(angle):
+    return angle % 360
+
+def compute_tithi(sun_lon, moon_lon):
+    angle = normalize_angle(moon_lon - sun_lon)
+    tithi_num = int(angle // 12) + 1
+    paksha = "Shukla" if tithi_num <= 15 else "Krishna"
+    if tithi_num > 15: tithi_num -= 15
+    return tithi_num, paksha
+
+def compute_nakshatra(moon_lon):
+    sidereal_moon_lon = normalize_angle(moon_lon - AYANAMSHA)
+    return nakshatras[int(sidereal_moon_lon / (360 / 27))]
+
+def compute_yoga(sun_lon, moon_lon):
+    sidereal_sun_lon = normalize_angle(sun_lon - AYANAMSHA)
+    sidereal_moon_lon = normalize_angle(moon_lon - AYANAMSHA)
+    total = normalize_angle(sidereal_sun_lon + sidereal_moon_lon)
+    return yogas[int(total / (360 / 27))]
+
+def compute_karana(tithi_num): return karanas[(tithi_num * 2 - 1) % 7]
+
+# ---------------- ANGULAR EVENT ENGINE ----------------
+# kind -> (degrees per division, number of divisions, sampling step in days)
+ANGULAR_EVENTS = {
+    "tithi": (12, 30, 0.25),
+    "nakshatra": (360 / 27, 27, 0.25),
+    "yoga": (360 / 27, 27, 0.25),
+    "karana": (6, 60, 0.125),
+}
+
+# the moon gains on the sun by 360 degrees per synodic month on average
+MEAN_ELONGATION_RATE = 360 / 29.530588853
+# solve_elongation() stops when a step is under 10 microseconds
+SOLVE_EPSILON_DAYS = 1e-5 / 86400
+
+def sun_moon_longitudes(t, exact=False):
+    """
+    Apparent sun and moon longitudes for a Skyfield Time, scalar or array, in one pass.
+    Read from the installed Chebyshev model where it covers t, unless `exact` is asked for.
+    """
+    model = None if exact else chebyshev.model_for(t.tt)
+    if model is not None:
+        return model.longitudes(t.tt)
+    earth, sun, moon = get_bodies()
+    observed(t, 2)
+    e = earth.at(t)
+    sun_lons = e.observe(sun).apparent().ecliptic_latlon()[1].degrees
+    moon_lons = e.observe(moon).apparent().ecliptic_latlon()[1].degrees
+    return sun_lons, moon_lons
+
+def angular_value(kind, sun_lons, moon_lons):
+    if kind in ("tithi", "karana"):
+        return normalize_angle(moon_lons - sun_lons)
+    if kind == "nakshatra":
+        return normalize_angle(moon_lons - AYANAMSHA)
+    if kind == "yoga":
+        return normalize_angle(sun_lons + moon_lons - 2 * AYANAMSHA)
+    raise ValueError(f"Unknown angular event: {kind}")
+
+def angular_rate(kind, sun_rates, moon_rates):
+    """Degrees per day at which angular_value() grows, from the sun's and moon's rates."""
+    if kind in ("tithi", "karana"):
+        return moon_rates - sun_rates
+    if kind == "nakshatra":
+        return moon_rates
+    return sun_rates + moon_rates
+
+def angular_index_function(kind):
+    """Builds a find_discrete() step function that evaluates a whole Time array at once."""
+    size, count, step_days = ANGULAR_EVENTS[kind]
+    def index_at(t):
+        sun_lons, moon_lons = sun_moon_longitudes(t)
+        angle = angular_value(kind, sun_lons, moon_lons)
+        return (np.floor((angle + 1e-9) / size) % count).astype(int)
+    index_at.step_days = step_days
+    return index_at
+
+def find_angular_transitions(kind, t0, t1):
+    """
+    find_discrete() over the angular index between two Times. With a Chebyshev model
+    covering the range, the search runs on the model and only its roots are refined
+    against Skyfield.
+    """
+    times, indices = find_discrete(t0, t1, angular_index_function(kind))
+    model = chebyshev.model_for([t0.tt, t1.tt])
+    if model is not None:
+        ts = get_timescale()
+        times = chebyshev.refine_roots(
+            times,
+            lambda tt: angular_value(kind, *sun_moon_longitudes(ts.tt_jd(tt), exact=True)),
+            lambda tt: angular_rate(kind, model.rate("sun_longitude", tt), model.rate("moon_longitude", tt)),
+            ANGULAR_EVENTS[kind][0],
+        )
+    return times, indices
+
+def solve_elongation(tt, target, max_steps=12):
+    """
+    TT Julian dates at which the moon's elongation from the sun is `target` degrees, one
+    near each guess in `tt` (within a day or so), by secant steps on the exact positions
+    with every instant in one Skyfield call per step. Returns the dates and the sun and
+    moon longitudes there.
+    """
+    ts = get_timescale()
+    def offset(tt):
+        sun_lons, moon_lons = sun_moon_longitudes(ts.tt_jd(tt), exact=True)
+        return (normalize_angle(moon_lons - sun_lons) - target + 180) % 360 - 180, sun_lons, moon_lons
+    tt0, (f0, _, _) = tt, offset(tt)
+    tt1 = tt0 - f0 / MEAN_ELONGATION_RATE
+    f1, sun_lons, moon_lons = offset(tt1)
+    for _ in range(max_steps):
+        slope = np.where(f1 != f0, (f1 - f0) / np.where(tt1 != tt0, tt1 - tt0, 1.0), MEAN_ELONGATION_RATE)
+        step = f1 / slope
+        if np.max(np.abs(step)) < SOLVE_EPSILON_DAYS:
+            break
+        tt0, f0 = tt1, f1
+        tt1 = tt1 - step
+        f1, sun_lons, moon_lons = offset(tt1)
+    return tt1, sun_lons, moon_lons
+
+def karana_name(index):
+    if index == 0: return fixed_karanas[0]
+    if index >= 57: return fixed_karanas[index - 56]
+    return karanas[(index - 1) % 7]
+
+def angular_span(kind, index, start, end):
+    index = int(index)
+    span = {"kind": kind, "index": index, "start": start, "end": end}
+    if kind == "tithi":
+        tithi_num = index + 1
+        span["paksha"] = "Shukla" if tithi_num <= 15 else "Krishna"
+        span["tithi_num"] = tithi_num - 15 if tithi_num > 15 else tithi_num
+        span["name"] = f"{span['paksha']} {span['tithi_num']}"
+    elif kind == "nakshatra":
+        span["name"] = nakshatras[index]
+    elif kind == "yoga":
+        span["name"] = yogas[index]
+    else:
+        span["name"] = karana_name(index)
+    return span
+
+# ---------------- SHARED INDEXES ----------------
+# module-level indexes are shared by every Panchang and thread in the process
+_index_lock = threading.Lock()
+_key_locks = {}  # (index id, key) -> lock held by the thread computing that entry
+
+def compute_once(index, key, compute, *args):
+    """
+    index[key], set to compute(*args) by the first thread to ask. Threads asking for the
+    same key meanwhile wait for that result; nothing is stored if compute() raises.
+    """
+    if key in index:
+        return index[key]
+    with _index_lock:
+        key_lock = _key_locks.setdefault((id(index), key), threading.Lock())
+    try:
+        with key_lock:
+            if key not in index:
+                index[key] = compute(*args)
+            return index[key]
+    finally:
+        with _index_lock:
+            _key_locks.pop((id(index), key), None)
+
+# ---------------- SANKRANTI INDEX ----------------
+sankranti_index = {}  # year -> ([ingress times in UTC], [rashi indices]), shared by every location
+
+def sidereal_rashi_function():
+    earth, sun, _ = get_bodies()
+    def rashi_at(t):
+        model = chebyshev.model_for(t.tt)
+        if model is not None:
+            tropical_lon = model.evaluate("sun_longitude", t.tt)
+        else:
+            observed(t)
+            tropical_lon = earth.at(t).observe(sun).apparent().ecliptic_latlon()[1].degrees
+        return (normalize_angle(tropical_lon - AYANAMSHA) // 30).astype(int)
+    rashi_at.step_days = 5
+    return rashi_at
+
+@timed("sankranti.year")
+def get_sankrantis(year):
+    """
+    Exact sidereal ingress times of the sun into each rashi during a (UTC) year.
+    Computed once per year with a single root search and then kept.
+    """
+    return compute_once(sankranti_index, year, _sankrantis_of_year, year)
+
+def _sankrantis_of_year(year):
+    ts = get_timescale()
+    t0, t1 = ts.utc(year, 1, 1), ts.utc(year + 1, 1, 1)
+    times, rashis = find_discrete(t0, t1, sidereal_rashi_function())
+    model = chebyshev.model_for([t0.tt, t1.tt])
+    if model is not None:
+        times = chebyshev.refine_roots(
+            times,
+            lambda tt: normalize_angle(sun_moon_longitudes(ts.tt_jd(tt), exact=True)[0] - AYANAMSHA),
+            lambda tt: model.rate("sun_longitude", tt),
+            30,
+        )
+    return list(times.utc_datetime()), [int(r) for r in rashis]
+
+def find_sankranti(moment, offset=0):
+    """Returns (ingress time, rashi index) of the last sankranti before the moment, or `offset` ingresses away from it."""
+    times, rashis = [], []
+    for year in (moment.year - 1, moment.year, moment.year + 1):
+        year_times, year_rashis = get_sankrantis(year)
+        times += year_times
+        rashis += year_rashis
+    i = bisect_right(times, moment) - 1 + offset
+    return times[i], rashis[i]
+
+# ---------------- ECLIPSE GEOMETRY ----------------
+SUN_RADIUS_KM, MOON_RADIUS_KM, EARTH_RADIUS_KM = 696000.0, 1737.4, 6378.137
+# No eclipse of either kind is possible when the moon is further than this from the ecliptic at syzygy
+ECLIPSE_LATITUDE_LIMIT = 1.6
+
+def eclipse_geometry(t, observer=None):
+    """
+    Sun-moon separation, apparent radii and horizontal parallaxes (all in degrees)
+    for a Skyfield Time, seen from the earth's centre or from an observer.
+    """
+    earth, sun, moon = get_bodies()
+    observed(t, 2)
+    e = (earth if observer is None else earth + observer).at(t)
+    s = e.observe(sun).apparent()
+    m = e.observe(moon).apparent()
+    sun_km, moon_km = s.distance().km, m.distance().km
+    return {
+        "separation": s.separation_from(m).degrees,
+        "sun_radius": np.degrees(np.arcsin(SUN_RADIUS_KM / sun_km)),
+        "moon_radius": np.degrees(np.arcsin(MOON_RADIUS_KM / moon_km)),
+        "sun_parallax": np.degrees(np.arcsin(EARTH_RADIUS_KM / sun_km)),
+        "moon_parallax": np.degrees(np.arcsin(EARTH_RADIUS_KM / moon_km)),
+    }
+
+def lunar_shadow_radii(g):
+    # Danjon's 2% enlargement of the earth's shadow for the atmosphere
+    umbra = 1.02 * (g["moon_parallax"] + g["sun_parallax"] - g["sun_radius"])
+    penumbra = 1.02 * (g["moon_parallax"] + g["sun_parallax"] + g["sun_radius"])
+    return umbra, penumbra
+
+def time_window(t, half_days):
+    ts = get_timescale()
+    return ts.tt_jd(t.tt - half_days), ts.tt_jd(t.tt + half_days)
+
+def closest_approach(t0, t1, distance):
+    distance.step_days = 1 / 24
+    times, values = find_minima(t0, t1, distance)
+    if not len(times):
+        return None
+    return times[int(np.argmin(values))]
+
+def contact_times(t_max, margin):
+    """
+    Root-searches the first and last contact around a maximum; margin(t) is positive while in eclipse.
+    No eclipse phase lasts longer than 6 hours either side of its maximum.
+    """
+    def in_eclipse(t):
+        return (margin(t) > 0).astype(int)
+    in_eclipse.step_days = 1 / 24
+    t0, t1 = time_window(t_max, 0.25)
+    before, _ = find_discrete(t0, t_max, in_eclipse, epsilon=1 / 86400)
+    after, _ = find_discrete(t_max, t1, in_eclipse, epsilon=1 / 86400)
+    return (before[-1] if len(before) else t0), (after[0] if len(after) else t1)
+
+@timed("eclipse.syzygies")
+def eclipse_syzygies(t0, t1):
+    """(time, phase) of each new (0) or full (2) moon in [t0, t1] close enough to the ecliptic for an eclipse."""
+    earth, _, moon = get_bodies()
+    times, phases = find_discrete(t0, t1, moon_phases(get_ephemeris()))
+    keep = (phases == 0) | (phases == 2)
+    syzygies, phases = times[keep], phases[keep]
+    if not len(syzygies):
+        return []
+    model = chebyshev.model_for(syzygies.tt)
+    if model is not None:
+        lunar_lat = model.evaluate("moon_latitude", syzygies.tt)
+    else:
+        observed(syzygies)
+        lunar_lat = earth.at(syzygies).observe(moon).apparent().ecliptic_latlon()[0].degrees
+    return [(t, int(phase)) for t, phase, lat in zip(syzygies, phases, lunar_lat) if abs(lat) < ECLIPSE_LATITUDE_LIMIT]
+
+# geocentric eclipse circumstances are the same for every location, so they are worked out once per syzygy
+eclipse_index = {}  # syzygy number -> (type, magnitude, t_start, t_max, t_end) or None
+MEAN_SYNODIC_MONTH = 29.530588853
+NEW_MOON_EPOCH_TT = 2451550.1  # mean new moon of 2000 January 6
+
+def syzygy_number(t):
+    """Counts half lunations from the 2000 epoch; new moons are even, full moons odd."""
+    return int(round((t.tt - NEW_MOON_EPOCH_TT) / (MEAN_SYNODIC_MONTH / 2)))
+
+def global_lunar_eclipse(t_full):
+    """(type, magnitude, t_start, t_max, t_end) of the lunar eclipse at a full moon, or None."""
+    return compute_once(eclipse_index, syzygy_number(t_full), _global_lunar_eclipse, t_full)
+
+@timed("eclipse.global_lunar")
+def _global_lunar_eclipse(t_full):
+    t0, t1 = time_window(t_full, 0.25)
+    t_max = closest_approach(t0, t1, lambda t: 180 - eclipse_geometry(t)["separation"])
+    if t_max is None:
+        return None
+    g = eclipse_geometry(t_max)
+    umbra, penumbra = lunar_shadow_radii(g)
+    distance = 180 - g["separation"]
+    umbral_mag = (umbra + g["moon_radius"] - distance) / (2 * g["moon_radius"])
+    penumbral_mag = (penumbra + g["moon_radius"] - distance) / (2 * g["moon_radius"])
+    if penumbral_mag <= 0:
+        return None
+
+    # contacts with the umbra for partial/total eclipses, with the penumbra otherwise
+    shadow = 0 if umbral_mag > 0 else 1
+    def margin(t):
+        g = eclipse_geometry(t)
+        return lunar_shadow_radii(g)[shadow] + g["moon_radius"] - (180 - g["separation"])
+    t_start, t_end = contact_times(t_max, margin)
+    eclipse_type = "Total" if umbral_mag >= 1 else "Partial" if umbral_mag > 0 else "Penumbral"
+    return eclipse_type, float(umbral_mag if umbral_mag > 0 else penumbral_mag), t_start, t_max, t_end
+
+def global_solar_eclipse(t_new):
+    """(type, magnitude, t_start, t_max, t_end) of the solar eclipse at a new moon, or None."""
+    return compute_once(eclipse_index, syzygy_number(t_new), _global_solar_eclipse, t_new)
+
+@timed("eclipse.global_solar")
+def _global_solar_eclipse(t_new):
+    t0, t1 = time_window(t_new, 0.25)
+    t_max = closest_approach(t0, t1, lambda t: eclipse_geometry(t)["separation"])
+    if t_max is None:
+        return None
+    g = eclipse_geometry(t_max)
+    # the shadow reaches some part of the earth when the geocentric discs come within the lunar parallax
+    reach = g["sun_radius"] + g["moon_radius"] + g["moon_parallax"] - g["sun_parallax"]
+    if g["separation"] >= reach:
+        return None
+    if g["separation"] < g["moon_parallax"] - g["sun_parallax"]:
+        eclipse_type = "Total" if g["moon_radius"] >= g["sun_radius"] else "Annular"
+        magnitude = g["moon_radius"] / g["sun_radius"]
+    else:
+        eclipse_type = "Partial"
+        magnitude = (reach - g["separation"]) / (2 * g["sun_radius"])
+
+    def global_margin(t):
+        g = eclipse_geometry(t)
+        return g["sun_radius"] + g["moon_radius"] + g["moon_parallax"] - g["sun_parallax"] - g["separation"]
+    t_start, t_end = contact_times(t_max, global_margin)
+    return eclipse_type, float(magnitude), t_start, t_max, t_end
+
+# ---------------- FESTIVAL RULES ----------------
+def get_festivals(dt, lunar_month=None, paksha=None, tithi_num=None, nakshatra=None):
+    """
+    Festivals falling on the tithi (when lunar_month, paksha and tithi_num are given) and on
+    the Gregorian/Hijri date of dt, looked up in the festival registry.
+    """
+    festivals = []
+    if lunar_month and paksha and tithi_num:
+        festivals.extend(festival_registry.tithi_festivals(lunar_month, paksha, tithi_num, nakshatra))
+    festivals.extend(festival_registry.date_festivals(dt))
+    return festivals
+
+# ---------------- PANCHANG ----------------
+class Panchang:
+    """
+    Panchang for one place. Location and timezone are explicit; the ephemeris and
+    timescale are loaded on first use and shared by every instance.
+    """
+
+    def __init__(self, latitude, longitude, zone=DEFAULT_ZONE, name=None):
+        self.latitude, self.longitude = latitude, longitude
+        self.zone = ZoneInfo(zone) if isinstance(zone, str) else zone
+        self.name = name or f"{latitude:.4f}, {longitude:.4f}"
+        self.location = wgs84.latlon(latitude, longitude)
+        self.sankranti_month_starts = {}  # ingress time -> first local date whose sunrise falls in the new rashi
+        self.rise_set_days = {}  # day ordinal -> (sunrise, sunset, moonrise, moonset) from get_rise_set_table()
+
+    def __repr__(self):
+        return f"Panchang({self.latitude!r}, {self.longitude!r}, zone={self.zone.key!r}, name={self.name!r})"
+
+    @property
+    def ts(self):
+        return get_timescale()
+
+    @property
+    def eph(self):
+        return get_ephemeris()
+
+    def to_local(self, dt):
+        return dt.astimezone(self.zone)
+
+    def now(self):
+        return datetime.now(self.zone)
+
+    def day_bounds(self, dt_local):
+        """Local midnight at the start of the day and of the next day."""
+        start = datetime(dt_local.year, dt_local.month, dt_local.day, tzinfo=self.zone)
+        return start, start + timedelta(days=1)
+
+    def get_utc_times_for_local_day(self, dt_local):
+        start_of_day, next_day = self.day_bounds(dt_local)
+        end_of_day = next_day - timedelta(seconds=1)
+        return to_utc(start_of_day), to_utc(end_of_day)
+
+    # ---------------- PANCHANG CALCULATIONS ----------------
+
+    @timed("rise_set.search")
+    def _rise_set_columns(self, body, day_start, day_count):
+        """
+        Rise and set times of a body for `day_count` local days from one find_discrete() search,
+        as per-day arrays of UTC timestamps. Days on which the body does not rise or set hold NaN.
+        """
+        f = risings_and_settings(self.eph, body, self.location)
+        day_end = day_start + timedelta(days=day_count)
+        t0, t1 = self.ts.from_datetime(to_utc(day_start)), self.ts.from_datetime(to_utc(day_end))
+        times, events = find_discrete(t0, t1, f)
+        rises, sets = np.full(day_count, np.nan), np.full(day_count, np.nan)
+        for when, e in zip(times.utc_datetime(), events):
+            day = (self.to_local(when).date() - day_start.date()).days
+            column = rises if e else sets
+            # keep the first event of the day if the body rises (or sets) twice
+            if 0 <= day < day_count and np.isnan(column[day]):
+                column[day] = when.timestamp()
+        return rises, sets
+
+    @timed("rise_set.table")
+    def get_rise_set_table(self, start_date, end_date):
+        """
+        Sunrise, sunset, moonrise and moonset for every local day in [start_date, end_date),
+        as a RISESET_DTYPE array (day ordinal plus UTC timestamps, NaN when there is none).
+        The days are also kept on the instance so get_sunrise_sunset()/get_moonrise_moonset()
+        answer them without another search.
+        """
+        day_start, _ = self.day_bounds(start_date)
+        day_count = end_date.toordinal() - start_date.toordinal()
+        _, sun, moon = get_bodies()
+        table = np.zeros(max(day_count, 0), RISESET_DTYPE)
+        if day_count <= 0:
+            return table
+        table["day"] = np.arange(day_count) + day_start.toordinal()
+        table["sunrise"], table["sunset"] = self._rise_set_columns(sun, day_start, day_count)
+        table["moonrise"], table["moonset"] = self._rise_set_columns(moon, day_start, day_count)
+        for row in table:
+            self.rise_set_days[int(row["day"])] = tuple(self._from_timestamp(row[c]) for c in RISESET_DTYPE.names[1:])
+        return table
+
+    def _from_timestamp(self, seconds):
+        return None if np.isnan(seconds) else datetime.fromtimestamp(float(seconds), tz=self.zone)
+
+    def _rise_set(self, body_index, dt_local):
+        known = self.rise_set_days.get(dt_local.toordinal())
+        if known is not None:
+            return known[2 * body_index - 2], known[2 * body_index - 1]
+        day_start, _ = self.day_bounds(dt_local)
+        rises, sets = self._rise_set_columns(get_bodies()[body_index], day_start, 1)
+        return self._from_timestamp(rises[0]), self._from_timestamp(sets[0])
+
+    def get_sunrise_sunset(self, dt_local):
+        return self._rise_set(1, dt_local)
+
+    def get_moonrise_moonset(self, dt_local):
+        return self._rise_set(2, dt_local)
+
+    def sun_longitude(self, dt_local):
+        earth, sun, _ = get_bodies()
+        t = self.ts.from_datetime(to_utc(dt_local))
+        model = chebyshev.model_for(t.tt)
+        if model is not None:
+            return model.evaluate("sun_longitude", t.tt)
+        observed(t)
+        return normalize_angle(earth.at(t).observe(sun).apparent().ecliptic_latlon()[1].degrees)
+
+    def moon_longitude(self, dt_local):
+        earth, _, moon = get_bodies()
+        t = self.ts.from_datetime(to_utc(dt_local))
+        model = chebyshev.model_for(t.tt)
+        if model is not None:
+            return model.evaluate("moon_longitude", t.tt)
+        observed(t)
+        return normalize_angle(earth.at(t).observe(moon).apparent().ecliptic_latlon()[1].degrees)
+
+    def iter_angular_events(self, kind, t_start_local, t_end_local, chunk_days=30):
+        """
+        Yields every tithi, nakshatra, yoga or karana span overlapping the local range
+        exactly once, in order, with exact start and end times.
+        The range is searched one chunk at a time, so decades can be streamed without
+        holding all transitions in memory. The search is padded so the first and last
+        spans are complete.
+        """
+        pad = timedelta(days=1.5)
+        cursor, search_end = t_start_local - pad, t_end_local + pad
+        prev_moment = prev_index = None
+        while cursor < search_end:
+            chunk_end = min(cursor + timedelta(days=chunk_days), search_end)
+            t0, t1 = self.ts.from_datetime(to_utc(cursor)), self.ts.from_datetime(to_utc(chunk_end))
+            times, indices = find_angular_transitions(kind, t0, t1)
+            for when, index in zip(times.utc_datetime(), indices):
+                moment = self.to_local(when)
+                if prev_moment is not None:
+                    # a root sitting exactly on a chunk edge can be reported by both chunks
+                    if moment <= prev_moment:
+                        continue
+                    if prev_moment >= t_end_local:
+                        return
+                    if moment > t_start_local:
+                        yield angular_span(kind, prev_index, prev_moment, moment)
+                prev_moment, prev_index = moment, index
+            cursor = chunk_end
+
+    def get_angular_events(self, kind, t_start_local, t_end_local):
+        return list(self.iter_angular_events(kind, t_start_local, t_end_local))
+
+    def iter_tithi_timeline(self, t_start_local, t_end_local, chunk_days=30):
+        """Streams each tithi (start, end, paksha, tithi_num) overlapping the range once, in order."""
+        return self.iter_angular_events("tithi", t_start_local, t_end_local, chunk_days)
+
+    def get_tithi_events(self, dt_local):
+        """
+        Calculates tithi transitions for the day.
+        Returns the tithis that start or end on the local date.
+        """
+        day_start, day_end = self.day_bounds(dt_local)
+        return [
+            tithi for tithi in self.iter_tithi_timeline(day_start, day_end)
+            if tithi['start'].date() == dt_local.date() or tithi['end'].date() == dt_local.date()
+        ]
+
+    @timed("moon_phases")
+    def moon_phase_events(self, dt_local):
+        phase_func = moon_phases(self.eph)
+        t0_utc, t1_utc = self.get_utc_times_for_local_day(dt_local)
+        t0, t1 = self.ts.from_datetime(t0_utc), self.ts.from_datetime(t1_utc)
+        times, events = find_discrete(t0, t1, phase_func)
+        return [(PHASE_NAMES[int(e)], self.to_local(t.utc_datetime())) for t, e in zip(times, events)]
+
+    # ---------------- BENGALI CALENDAR ----------------
+
+    def sankranti_month_start(self, ingress):
+        if ingress not in self.sankranti_month_starts:
+            local_ingress = self.to_local(ingress)
+            sunrise, _ = self.get_sunrise_sunset(local_ingress)
+            if sunrise is None:
+                sunrise = datetime(local_ingress.year, local_ingress.month, local_ingress.day, 6, tzinfo=self.zone)
+            start = local_ingress.date() if sunrise >= ingress else local_ingress.date() + timedelta(days=1)
+            self.sankranti_month_starts[ingress] = start
+        return self.sankranti_month_starts[ingress]
+
+    def tithi_observance_day(self, tithi):
+        """
+        The local date whose sunrise falls within the tithi. A tithi that holds no sunrise
+        (a kshaya tithi) is observed on the day it begins.
+        """
+        start_day = self.to_local(tithi['start'])
+        for day in (start_day, start_day + timedelta(days=1)):
+            sunrise, _ = self.get_sunrise_sunset(day)
+            if sunrise is not None and tithi['start'] <= sunrise < tithi['end']:
+                return day.date()
+        return start_day.date()
+
+    @timed("bengali.year")
+    def compute_bengali_year(self, dt_local):
+        # Pohela Boishakh is the first day of the solar month that follows the Mesha sankranti
+        mesha_ingress = next(t for t, r in zip(*get_sankrantis(dt_local.year)) if r == 0)
+        pohela_boishakh = self.sankranti_month_start(mesha_ingress)
+        return dt_local.year - 593 if dt_local.date() >= pohela_boishakh else dt_local.year - 594
+
+    @timed("bengali.month_day")
+    def compute_bengali_month_day(self, dt_local, return_rashi_index=False):
+        # The month is the rashi of the sun at sunrise, so the last ingress before the day ends
+        # only counts once its first sunrise has passed.
+        _, day_end = self.day_bounds(dt_local)
+        ingress, rashi_index = find_sankranti(day_end)
+        month_start_date = self.sankranti_month_start(ingress)
+        if month_start_date > dt_local.date():
+            ingress, rashi_index = find_sankranti(day_end, offset=-1)
+            month_start_date = self.sankranti_month_start(ingress)
+        bengali_month = bengali_months[rashi_index]
+        bengali_day = (dt_local.date() - month_start_date).days + 1
+
+        if return_rashi_index:
+            return bengali_month, bengali_day, rashi_index
+        return bengali_month, bengali_day
+
+    # ---------------- ECLIPSE DETECTION ----------------
+
+    def above_horizon(self, body, t_start, t_end):
+        earth = get_bodies()[0]
+        samples = max(2, int((t_end.tt - t_start.tt) * 24 * 6) + 2)
+        t = self.ts.tt_jd(np.linspace(t_start.tt, t_end.tt, samples))
+        observed(t)
+        alt, _, _ = (earth + self.location).at(t).observe(body).apparent().altaz()
+        return bool(np.any(alt.degrees > 0))
+
+    def as_local(self, t):
+        return self.to_local(t.utc_datetime())
+
+    @timed("eclipse.lunar_local")
+    def lunar_eclipse_at(self, t_full):
+        found = global_lunar_eclipse(t_full)
+        if found is None:
+            return None
+        eclipse_type, magnitude, t_start, t_max, t_end = found
+        visible = self.above_horizon(get_bodies()[2], t_start, t_end)
+        return {
+            "kind": "Lunar Eclipse", "type": eclipse_type, "magnitude": magnitude,
+            "start": self.as_local(t_start), "max": self.as_local(t_max), "end": self.as_local(t_end),
+            "visible": visible,
+            "local_magnitude": magnitude if visible else 0.0,
+        }
+
+    @timed("eclipse.solar_local")
+    def solar_eclipse_at(self, t_new):
+        found = global_solar_eclipse(t_new)
+        if found is None:
+            return None
+        eclipse_type, magnitude, t_start, t_max, t_end = found
+        entry = {
+            "kind": "Solar Eclipse", "type": eclipse_type, "magnitude": magnitude,
+            "start": self.as_local(t_start), "max": self.as_local(t_max), "end": self.as_local(t_end),
+            "visible": False, "local_magnitude": 0.0,
+        }
+
+        # local circumstances from the observer's own line of sight
+        def local_margin(t):
+            g = eclipse_geometry(t, self.location)
+            return g["sun_radius"] + g["moon_radius"] - g["separation"]
+        t0, t1 = time_window(t_new, 0.25)
+        t_local_max = closest_approach(t0, t1, lambda t: eclipse_geometry(t, self.location)["separation"])
+        if t_local_max is not None and local_margin(t_local_max) > 0:
+            t_local_start, t_local_end = contact_times(t_local_max, local_margin)
+            if self.above_horizon(get_bodies()[1], t_local_start, t_local_end):
+                gl = eclipse_geometry(t_local_max, self.location)
+                entry.update({
+                    "visible": True,
+                    "local_magnitude": float(local_margin(t_local_max) / (2 * gl["sun_radius"])),
+                    "local_start": self.as_local(t_local_start), "local_max": self.as_local(t_local_max),
+                    "local_end": self.as_local(t_local_end),
+                })
+        return entry
+
+    def iter_eclipses(self, t_start_local, t_end_local):
+        """
+        Yields eclipses in the range by testing only new and full moons.
+        Syzygies with the moon too far from the ecliptic are rejected before any refinement.
+        """
+        for t, phase in eclipse_syzygies(self.ts.from_datetime(to_utc(t_start_local)), self.ts.from_datetime(to_utc(t_end_local))):
+            eclipse = self.solar_eclipse_at(t) if phase == 0 else self.lunar_eclipse_at(t)
+            if eclipse is not None:
+                yield eclipse
+
+    def get_eclipse_catalog(self, start_year, end_year):
+        """Every solar and lunar eclipse from start_year to end_year inclusive, with type, magnitude and local visibility."""
+        start = datetime(start_year, 1, 1, tzinfo=self.zone)
+        end = datetime(end_year + 1, 1, 1, tzinfo=self.zone)
+        return list(self.iter_eclipses(start, end))
+
+    def eclipses_on_day(self, eclipses, dt_local):
+        """The (name, start, max, end) of each visible eclipse that is under way during the local day."""
+        day_start, day_end = self.day_bounds(dt_local)
+        results = []
+        for eclipse in eclipses:
+            if not eclipse["visible"]:
+                continue
+            start = eclipse.get("local_start", eclipse["start"])
+            max_time = eclipse.get("local_max", eclipse["max"])
+            end = eclipse.get("local_end", eclipse["end"])
+            if start < day_end and end >= day_start:
+                results.append((f"{eclipse['type']} {eclipse['kind']}", start, max_time, end))
+        return results
+
+    @timed("eclipse.detect")
+    def detect_eclipses(self, dt_local):
+        day_start, day_end = self.day_bounds(dt_local)
+        # an eclipse lasts well under a day, so its syzygy lies within a day of any local day it touches
+        return self.eclipses_on_day(self.iter_eclipses(day_start - timedelta(days=1), day_end + timedelta(days=1)), dt_local)
+
+    # ---------------- FESTIVALS ----------------
+
+    def get_monthly_festivals(self, year, month):
+        """Festivals of a Gregorian month as (name, start, end) tuples, in order."""
+        start_date = datetime(year, month, 1, tzinfo=self.zone)
+        if month == 12: end_date = datetime(year + 1, 1, 1, tzinfo=self.zone)
+        else: end_date = datetime(year, month + 1, 1, tzinfo=self.zone)
+        return self.get_festivals_between(start_date, end_date)
+
+    @timed("festivals.between")
+    def get_festivals_between(self, start_date, end_date):
+        """
+        Festivals from local midnight start_date up to end_date as (name, start, end) tuples, in order.
+        Tithi festivals are included for every tithi that overlaps the range.
+        """
+        # One streaming search over the range yields each overlapping tithi exactly once.
+        found_festivals = []
+        unique_entries = set()
+
+        for tithi_event in self.iter_tithi_timeline(start_date, end_date):
+            lunar_month_at_start = lunar_months[find_sankranti(tithi_event['start'])[1]]
+            paksha = tithi_event['paksha']
+            tithi_num = tithi_event['tithi_num']
+            nakshatra_at_start = compute_nakshatra(self.moon_longitude(tithi_event['start']))
+
+            # date festivals come once each from festivals_by_date() below, not with every tithi
+            fests = festival_registry.tithi_festivals(lunar_month_at_start, paksha, tithi_num, nakshatra_at_start)
+
+            for fest in fests:
+                # Create a unique key to prevent duplicates
+                key = (fest, tithi_event['start'], tithi_event['end'])
+                if key not in unique_entries:
+                    found_festivals.append((fest, tithi_event['start'], tithi_event['end']))
+                    unique_entries.add(key)
+
+            # festivals kept on the day whose sunrise the tithi covers are listed on that date
+            sunrise_fests = festival_registry.tithi_festivals(lunar_month_at_start, paksha, tithi_num, nakshatra_at_start, observance="sunrise")
+            if sunrise_fests:
+                observed_day = self.tithi_observance_day(tithi_event)
+                observed_midnight = datetime(observed_day.year, observed_day.month, observed_day.day, tzinfo=self.zone)
+                if start_date <= observed_midnight < end_date:
+                    for fest in sunrise_fests:
+                        key = (fest, observed_day)
+                        if key not in unique_entries:
+                            found_festivals.append((fest, observed_midnight, observed_midnight))
+                            unique_entries.add(key)
+
+        # Add date-based festivals, with the Hijri calendar for the whole range computed at once
+        date_fests = festival_registry.festivals_by_date(start_date.date(), (end_date - timedelta(days=1)).date())
+        current_date_solar = start_date
+        while current_date_solar < end_date:
+            solar_fests = date_fests.get(current_date_solar.date(), ())
+            for fest in solar_fests:
+                key = (fest, current_date_solar.date())
+                if key not in unique_entries:
+                    found_festivals.append((fest, current_date_solar, current_date_solar))
+                    unique_entries.add(key)
+            current_date_solar += timedelta(days=1)
+
+        found_festivals.sort(key=lambda x: x[1])
+        return found_festivals
+
+    @timed("festivals.find")
+    def find_festival(self, name, start_year, end_year=None):
+        """
+        When a festival falls from start_year to end_year inclusive, without walking the days.
+        A tithi festival's tithi is solved for directly in every lunation of the range and kept
+        where the sun's rashi names the rule's lunar month; date festivals are read off the calendar.
+        Returns dicts with name, date (the local day it is kept), start and end (the tithi, or
+        the whole day for date festivals), in order.
+        """
+        end_year = start_year if end_year is None else end_year
+        rules = festival_registry.rules_named(name)
+        if not rules:
+            raise ValueError(f"no festival called {name!r}")
+        range_start = datetime(start_year, 1, 1, tzinfo=self.zone)
+        range_end = datetime(end_year + 1, 1, 1, tzinfo=self.zone)
+        found = []
+        for rule in rules:
+            if "tithi" in rule:
+                found.extend(self._find_tithi_festival(rule, range_start, range_end))
+                continue
+            if "solar_date" in rule:
+                days = []
+                for month, day in month_days(rule["solar_date"], "solar_date"):
+                    for year in range(start_year, end_year + 1):
+                        try:
+                            days.append(date(year, month, day))
+                        except ValueError:
+                            continue  # 29 February outside leap years
+            else:
+                last_day = (range_end - timedelta(days=1)).date()
+                days = [
+                    day for hijri_month, hijri_day in month_days(rule["hijri_date"], "hijri_date")
+                    for day in gregorian_dates_for_hijri(hijri_month, hijri_day, range_start.date(), last_day)
+                ]
+            for day in days:
+                start, end = self.day_bounds(day)
+                found.append({"name": rule["name"], "date": day, "start": start, "end": end})
+        found.sort(key=lambda f: (f["start"], f["name"]))
+        return found
+
+    def _find_tithi_festival(self, rule, range_start, range_end):
+        rashi = lunar_months.index(rule["lunar_month"])
+        index = rule["tithi"] - 1 + (15 if rule["paksha"] == "Krishna" else 0)
+        # the tithi comes once a lunation: solve for its start and end in every lunation
+        # of the range at once, starting from their mean times
+        first = self.ts.from_datetime(to_utc(range_start - timedelta(days=2))).tt
+        last = self.ts.from_datetime(to_utc(range_end + timedelta(days=2))).tt
+        lunations = np.arange(
+            np.floor((first - NEW_MOON_EPOCH_TT) / MEAN_SYNODIC_MONTH) - 1,
+            np.ceil((last - NEW_MOON_EPOCH_TT) / MEAN_SYNODIC_MONTH) + 1,
+        )
+        n = len(lunations)
+        guesses = NEW_MOON_EPOCH_TT + MEAN_SYNODIC_MONTH * np.concatenate([lunations + index / 30, lunations + (index + 1) / 30])
+        targets = np.repeat([index * 12.0, (index + 1) * 12.0 % 360], n)
+        tt, sun_lons, moon_lons = solve_elongation(guesses, targets)
+        # the lunar month is named by the sun's rashi when the tithi begins
+        rashis = (normalize_angle(sun_lons[:n] - AYANAMSHA) // 30).astype(int)
+        moments = [self.to_local(when) for when in self.ts.tt_jd(tt).utc_datetime()]
+        found = []
+        for k in np.nonzero(rashis == rashi)[0]:
+            start, end = moments[k], moments[n + k]
+            if "nakshatra" in rule and compute_nakshatra(moon_lons[k]) != rule["nakshatra"]:
+                continue
+            span = angular_span("tithi", index, start, end)
+            day = self.tithi_observance_day(span) if rule["observance"] == "sunrise" else start.date()
+            if range_start.date() <= day < range_end.date():
+                found.append(dict(span, name=rule["name"], date=day, lunar_month=rule["lunar_month"]))
+        return found
+
+    @timed("daily_panchang")
+    def daily_panchang(self, date_input=None):
+        """Everything on the daily sheet for one local day, as a dict."""
+        dt_local = date_input or self.now()
+        day_start, day_end = self.day_bounds(dt_local)
+        spans = {}
+        for kind in ANGULAR_EVENTS:
+            with stage(f"angular_events.{kind}"):
+                spans[kind] = self.get_angular_events(kind, day_start, day_end)
+        longitudes = (self.sun_longitude(dt_local), self.moon_longitude(dt_local))
+        return self.assemble_day(dt_local, longitudes, spans, self.moon_phase_events(dt_local), self.detect_eclipses(dt_local))
+
+    @timed("daily_panchang.assemble")
+    def assemble_day(self, dt_local, longitudes, spans, phases, eclipses):
+        """
+        Builds the daily sheet from the geocentric pieces (longitudes at the instant, the day's
+        tithi/nakshatra/yoga/karana spans, moon phases, eclipses) plus this location's own
+        sunrise-anchored quantities.
+        """
+        sun_lon, moon_lon = longitudes
+        tithi_num_current, paksha = compute_tithi(sun_lon, moon_lon)
+        nakshatra = compute_nakshatra(moon_lon)
+        yoga = compute_yoga(sun_lon, moon_lon)
+        karana = compute_karana(tithi_num_current)
+        sunrise, sunset = self.get_sunrise_sunset(dt_local)
+        moonrise, moonset = self.get_moonrise_moonset(dt_local)
+        bengali_year = self.compute_bengali_year(dt_local)
+        bengali_month, bengali_day, rashi_index = self.compute_bengali_month_day(dt_local, return_rashi_index=True)
+        lunar_month = lunar_months[rashi_index]
+        tithi_events = spans["tithi"]
+        angular_spans = {kind: spans[kind] for kind in ("nakshatra", "yoga", "karana")}
+        # compute_karana() only sees the tithi number; the karana span knows which half of the tithi we are in
+        karana = next((k['name'] for k in angular_spans["karana"] if k['start'] <= dt_local < k['end']), karana)
+
+        # --- Collect Festivals for Today ---
+        daily_festivals = []
+        daily_festivals.extend(get_festivals(dt_local))
+        for tithi in tithi_events:
+            daily_festivals.extend(festival_registry.tithi_festivals(lunar_month, tithi['paksha'], tithi['tithi_num'], nakshatra))
+        if "sunrise" in festival_registry.observances:
+            for tithi in tithi_events:
+                sunrise_fests = festival_registry.tithi_festivals(lunar_month, tithi['paksha'], tithi['tithi_num'], nakshatra, observance="sunrise")
+                if sunrise_fests and self.tithi_observance_day(tithi) == dt_local.date():
+                    daily_festivals.extend(sunrise_fests)
+
+        return {
+            "date": dt_local,
+            "bengali_date": (bengali_month, bengali_day, bengali_year),
+            "lunar_month": lunar_month,
+            "tithi": tithi_num_current,
+            "paksha": paksha,
+            "tithi_events": tithi_events,
+            "nakshatra": nakshatra,
+            "yoga": yoga,
+            "karana": karana,
+            "angular_spans": angular_spans,
+            "sunrise": sunrise, "sunset": sunset,
+            "moonrise": moonrise, "moonset": moonset,
+            "festivals": sorted(set(daily_festivals)),
+            "moon_phases": phases,
+            "eclipses": eclipses,
+        }
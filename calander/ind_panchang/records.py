@@ -0,0 +1,218 @@
+"""
+Compact, typed result records.
+
+Panchang methods return plain dicts and tuples. The classes here hold the same results
+in fixed __slots__ fields, so millions of them stay small, and know how to turn
+themselves into JSON-ready dicts, CSV rows and iCalendar events for export.
+Records still answer record["start"] like the dicts they are built from.
+SpanArray keeps long runs of tithi/nakshatra/yoga/karana spans in a numpy array.
+"""
+from abc import ABC, abstractmethod
+from datetime import date, datetime, timezone
+
+import numpy as np
+
+from .panchang import angular_span
+
+# UTC start and end timestamps plus the span's index (tithi 0-29, karana 0-59, ...)
+SPAN_DTYPE = np.dtype([("start", "<f8"), ("end", "<f8"), ("index", "<i2")])
+
+
+def to_json(value):
+    """Turns panchang results (records, datetimes, dates, tuples, numpy scalars) into JSON-ready values."""
+    if isinstance(value, Record):
+        return value.as_json()
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, dict):
+        return {str(k): to_json(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple, set)):
+        return [to_json(v) for v in value]
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def _cell(value):
+    if value is None:
+        return ""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (list, tuple)):
+        return "; ".join(str(_cell(v)) for v in value)
+    return value
+
+
+class Record(ABC):
+    """Base class: fields are the __slots__, in order. Subclasses say how they appear in a calendar."""
+    __slots__ = ()
+    # fields written to CSV, in order; nested fields are left to JSON
+    csv_fields = ()
+
+    def __init__(self, *args, **kwargs):
+        if len(args) > len(self.__slots__):
+            raise TypeError(f"{type(self).__name__} takes at most {len(self.__slots__)} fields")
+        for name, value in zip(self.__slots__, args):
+            setattr(self, name, value)
+        for name in self.__slots__[len(args):]:
+            setattr(self, name, kwargs.pop(name, None))
+        if kwargs:
+            raise TypeError(f"{type(self).__name__} has no field {next(iter(kwargs))!r}")
+
+    @classmethod
+    def from_dict(cls, d):
+        return cls(**{name: d[name] for name in cls.__slots__ if name in d})
+
+    def __getitem__(self, name):
+        # code written against the dict results keeps working
+        try:
+            return getattr(self, name)
+        except AttributeError:
+            raise KeyError(name)
+
+    def get(self, name, default=None):
+        return getattr(self, name, default) if name in self.__slots__ else default
+
+    def __eq__(self, other):
+        return type(self) is type(other) and all(getattr(self, n) == getattr(other, n) for n in self.__slots__)
+
+    def __repr__(self):
+        fields = ", ".join(f"{n}={getattr(self, n)!r}" for n in self.__slots__ if getattr(self, n) is not None)
+        return f"{type(self).__name__}({fields})"
+
+    def as_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def as_json(self):
+        return to_json(self.as_dict())
+
+    def csv_row(self):
+        return [_cell(getattr(self, name)) for name in self.csv_fields]
+
+    @abstractmethod
+    def ics_event(self):
+        """(uid, summary, start, end, description) for an iCalendar VEVENT; dates make all-day events."""
+
+
+class Span(Record):
+    """One tithi, nakshatra, yoga or karana with its start and end."""
+    __slots__ = ("kind", "index", "name", "start", "end", "paksha", "tithi_num")
+    csv_fields = __slots__
+
+    def ics_event(self):
+        uid = f"{self.kind}-{self.index}-{_utc_stamp(self.start)}"
+        return uid, f"{self.kind.title()} {self.name}", self.start, self.end, ""
+
+
+class Festival(Record):
+    """A festival: `date` is the local day it is kept; start/end are its tithi, or the whole day for date festivals."""
+    __slots__ = ("name", "date", "start", "end")
+    csv_fields = __slots__
+
+    @classmethod
+    def from_tuple(cls, entry):
+        # (name, start, end) as returned by get_monthly_festivals(); date festivals have start == end
+        name, start, end = entry
+        return cls(name, start.date(), start, end)
+
+    @property
+    def all_day(self):
+        return self.start == self.end or self.start.time() == self.end.time() == datetime.min.time()
+
+    def ics_event(self):
+        slug = "".join(c if c.isalnum() else "-" for c in self.name.lower())
+        if self.all_day:
+            return f"festival-{slug}-{self.date:%Y%m%d}", self.name, self.date, None, ""
+        return f"festival-{slug}-{_utc_stamp(self.start)}", self.name, self.start, self.end, f"Tithi until {self.end:%d %b %H:%M}"
+
+
+class Eclipse(Record):
+    """An eclipse with its geocentric circumstances and, when visible, the local ones."""
+    __slots__ = (
+        "kind", "type", "magnitude", "start", "max", "end", "visible", "local_magnitude",
+        "local_start", "local_max", "local_end",
+    )
+    csv_fields = __slots__
+
+    def ics_event(self):
+        start = self.local_start or self.start
+        end = self.local_end or self.end
+        summary = f"{self.type} {self.kind}"
+        description = f"Magnitude {self.magnitude:.3f}"
+        if self.visible:
+            description += f", locally {self.local_magnitude:.3f}"
+        return f"eclipse-{_utc_stamp(self.max)}", summary, start, end, description
+
+
+class DaySheet(Record):
+    """Everything on the daily sheet for one local day."""
+    __slots__ = (
+        "date", "bengali_month", "bengali_day", "bengali_year", "lunar_month", "tithi", "paksha",
+        "nakshatra", "yoga", "karana", "sunrise", "sunset", "moonrise", "moonset",
+        "festivals", "tithi_events", "angular_spans", "moon_phases", "eclipses",
+    )
+    csv_fields = __slots__[:15]
+
+    @classmethod
+    def from_dict(cls, day):
+        """Builds a sheet from Panchang.daily_panchang()."""
+        bengali_month, bengali_day, bengali_year = day["bengali_date"]
+        return cls(
+            day["date"], bengali_month, bengali_day, bengali_year, day["lunar_month"], day["tithi"], day["paksha"],
+            day["nakshatra"], day["yoga"], day["karana"], day["sunrise"], day["sunset"], day["moonrise"], day["moonset"],
+            tuple(day["festivals"]),
+            tuple(Span.from_dict(s) for s in day["tithi_events"]),
+            {kind: tuple(Span.from_dict(s) for s in spans) for kind, spans in day["angular_spans"].items()},
+            tuple(day["moon_phases"]),
+            tuple(day["eclipses"]),
+        )
+
+    @property
+    def bengali_date(self):
+        return self.bengali_month, self.bengali_day, self.bengali_year
+
+    def ics_event(self):
+        day = self.date.date() if isinstance(self.date, datetime) else self.date
+        summary = f"{self.bengali_month} {self.bengali_day}, {self.bengali_year} · {self.paksha} {self.tithi} · {self.nakshatra}"
+        description = "; ".join(self.festivals)
+        return f"day-{day:%Y%m%d}", summary, day, None, description
+
+
+def _utc_stamp(moment):
+    return moment.astimezone(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+class SpanArray:
+    """
+    Spans of one kind held as a SPAN_DTYPE array (18 bytes each) instead of dicts.
+    Indexing or iterating gives Span records in the array's time zone.
+    """
+
+    def __init__(self, kind, data, zone):
+        self.kind, self.data, self.zone = kind, data, zone
+
+    @classmethod
+    def from_spans(cls, kind, spans, zone):
+        rows = ((s["start"].timestamp(), s["end"].timestamp(), s["index"]) for s in spans)
+        return cls(kind, np.fromiter(rows, SPAN_DTYPE), zone)
+
+    def __len__(self):
+        return len(self.data)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return SpanArray(self.kind, self.data[i], self.zone)
+        row = self.data[i]
+        start = datetime.fromtimestamp(float(row["start"]), tz=self.zone)
+        end = datetime.fromtimestamp(float(row["end"]), tz=self.zone)
+        return Span.from_dict(angular_span(self.kind, row["index"], start, end))
+
+    def __iter__(self):
+        for i in range(len(self.data)):
+            yield self[i]
+
+    def between(self, start, end):
+        """The spans overlapping [start, end), found by binary search."""
+        lo = np.searchsorted(self.data["end"], start.timestamp(), side="right")
+        hi = np.searchsorted(self.data["start"], end.timestamp(), side="left")
+        return self[lo:max(lo, hi)]
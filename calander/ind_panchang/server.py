@@ -0,0 +1,269 @@
+"""
+Panchang over HTTP as JSON, using only the standard library.
+
+    python -m ind_panchang.server --port 8080
+    GET /day?lat=22.57&lon=88.36[&zone=Asia/Kolkata][&date=2025-10-01[T12:00]]
+    GET /month?lat=22.57&lon=88.36&year=2025&month=10
+    GET /range?lat=22.57&lon=88.36&start=2025-10-01&end=2025-12-31
+    GET /festival?lat=22.57&lon=88.36&name=Diwali&start_year=2025[&end_year=2034]
+
+Skyfield work runs on a bounded thread or process pool so the event loop never blocks.
+Identical requests that arrive while one is being computed wait for that computation
+instead of starting their own, and answers are kept for a while in an LRU cache.
+Each worker keeps one Panchang per place; in the thread pool, requests for the same
+place take turns with it while other places run in parallel.
+"""
+import argparse
+import asyncio
+import json
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from functools import lru_cache
+from urllib.parse import parse_qsl, urlsplit
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from .ephemeris import worker_pool
+from .panchang import Panchang, DEFAULT_ZONE
+from .records import to_json
+
+MAX_RANGE_DAYS = 3660
+MAX_FESTIVAL_YEARS = 100
+STATUS_TEXT = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 500: "Internal Server Error"}
+
+
+@lru_cache(maxsize=256)
+def get_place(latitude, longitude, zone):
+    """
+    (Panchang, lock) for a place, one per worker, so its sunrise and month-start caches
+    are reused. Those caches are not thread-safe: hold the lock while using the Panchang.
+    """
+    return Panchang(latitude, longitude, zone), threading.Lock()
+
+
+def _number(params, name):
+    try:
+        return float(params[name])
+    except KeyError:
+        raise ValueError(f"missing parameter {name!r}")
+    except ValueError:
+        raise ValueError(f"parameter {name!r} must be a number")
+
+
+def _integer(params, name, default=None):
+    if name not in params:
+        if default is None:
+            raise ValueError(f"missing parameter {name!r}")
+        return default
+    try:
+        return int(params[name])
+    except ValueError:
+        raise ValueError(f"parameter {name!r} must be an integer")
+
+
+def _date(params, name, zone):
+    try:
+        when = datetime.fromisoformat(params[name])
+    except KeyError:
+        raise ValueError(f"missing parameter {name!r}")
+    except ValueError:
+        raise ValueError(f"parameter {name!r} must be an ISO date like 2025-10-01")
+    return when.astimezone(zone) if when.tzinfo else when.replace(tzinfo=zone)
+
+
+def parse_query(path, params):
+    """
+    Validates a request and returns its cache key: a tuple of plain values that fully
+    describes the computation. A day request without a date means the current minute.
+    """
+    latitude, longitude = _number(params, "lat"), _number(params, "lon")
+    if not (-90 <= latitude <= 90 and -180 <= longitude <= 180):
+        raise ValueError("lat must be within ±90 and lon within ±180")
+    zone_name = params.get("zone", DEFAULT_ZONE)
+    try:
+        zone = ZoneInfo(zone_name)
+    except (ZoneInfoNotFoundError, ValueError):
+        raise ValueError(f"unknown time zone {zone_name!r}")
+    place = (round(latitude, 4), round(longitude, 4), zone_name)
+
+    if path == "/day":
+        when = _date(params, "date", zone) if "date" in params else datetime.now(zone).replace(second=0, microsecond=0)
+        return ("day",) + place + (when.isoformat(),)
+    if path == "/month":
+        year, month = _integer(params, "year"), _integer(params, "month")
+        if not 1 <= month <= 12:
+            raise ValueError("month must be from 1 to 12")
+        return ("month",) + place + (year, month)
+    if path == "/range":
+        start, end = _date(params, "start", zone), _date(params, "end", zone)
+        if not 0 <= (end - start).days <= MAX_RANGE_DAYS:
+            raise ValueError(f"end must be on or after start and at most {MAX_RANGE_DAYS} days later")
+        return ("range",) + place + (start.date().isoformat(), end.date().isoformat())
+    if path == "/festival":
+        if not params.get("name"):
+            raise ValueError("missing parameter 'name'")
+        start_year = _integer(params, "start_year")
+        end_year = _integer(params, "end_year", start_year)
+        if not 0 <= end_year - start_year < MAX_FESTIVAL_YEARS:
+            raise ValueError(f"end_year must be on or after start_year and span under {MAX_FESTIVAL_YEARS} years")
+        return ("festival",) + place + (params["name"], start_year, end_year)
+    raise LookupError(path)
+
+
+def compute(key):
+    """Runs one query described by a parse_query() key; safe to call from pool threads or worker processes."""
+    kind, latitude, longitude, zone_name = key[:4]
+    panchang, lock = get_place(latitude, longitude, zone_name)
+    with lock:
+        return _answer(panchang, kind, key[4:])
+
+
+def _answer(panchang, kind, args):
+    if kind == "day":
+        return to_json(panchang.daily_panchang(datetime.fromisoformat(args[0]).astimezone(panchang.zone)))
+    if kind == "month":
+        festivals = panchang.get_monthly_festivals(*args)
+    elif kind == "range":
+        start = datetime.fromisoformat(args[0]).replace(tzinfo=panchang.zone)
+        end = datetime.fromisoformat(args[1]).replace(tzinfo=panchang.zone) + timedelta(days=1)
+        festivals = panchang.get_festivals_between(start, end)
+    else:
+        return to_json(panchang.find_festival(*args))
+    return to_json([{"name": fest, "start": start, "end": end} for fest, start, end in festivals])
+
+
+class PanchangService:
+    """Coalesces identical requests, caches answers and runs the work on a bounded executor."""
+
+    def __init__(self, workers=4, executor="thread", cache_size=1024, cache_ttl=300):
+        if executor == "process":
+            self.executor = worker_pool(workers)
+        else:
+            self.executor = ThreadPoolExecutor(max_workers=workers)
+        self.cache_size, self.cache_ttl = cache_size, cache_ttl
+        self.cache = OrderedDict()  # key -> (expiry, result), least recently used first
+        self.in_flight = {}  # key -> Future shared by every request waiting on it
+        self.stats = {"requests": 0, "computed": 0, "cache_hits": 0, "coalesced": 0}
+
+    def cached(self, key):
+        entry = self.cache.get(key)
+        if entry is None:
+            return None
+        if entry[0] < time.monotonic():
+            del self.cache[key]
+            return None
+        self.cache.move_to_end(key)
+        return entry
+
+    async def query(self, key):
+        self.stats["requests"] += 1
+        entry = self.cached(key)
+        if entry is not None:
+            self.stats["cache_hits"] += 1
+            return entry[1]
+        future = self.in_flight.get(key)
+        if future is not None:
+            self.stats["coalesced"] += 1
+            return await asyncio.shield(future)
+
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self.executor, compute, key)
+        self.in_flight[key] = future
+        self.stats["computed"] += 1
+        try:
+            result = await asyncio.shield(future)
+        finally:
+            self.in_flight.pop(key, None)
+        self.cache[key] = (time.monotonic() + self.cache_ttl, result)
+        while len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+        return result
+
+    async def respond(self, method, target):
+        """Returns (status, body) for one request."""
+        if method != "GET":
+            return 405, {"error": "only GET is supported"}
+        url = urlsplit(target)
+        if url.path == "/stats":
+            return 200, dict(self.stats, cached=len(self.cache), in_flight=len(self.in_flight))
+        try:
+            key = parse_query(url.path, dict(parse_qsl(url.query)))
+        except LookupError:
+            return 404, {"error": f"unknown path {url.path!r}"}
+        except ValueError as e:
+            return 400, {"error": str(e)}
+        try:
+            return 200, await self.query(key)
+        except ValueError as e:
+            return 400, {"error": str(e)}
+        except Exception as e:
+            return 500, {"error": f"{type(e).__name__}: {e}"}
+
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                try:
+                    method, target, version = request_line.decode("latin-1").split()
+                except ValueError:
+                    status, body, version = 400, {"error": "malformed request line"}, "HTTP/1.0"
+                else:
+                    status, body = await self.respond(method, target)
+                keep_alive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+                payload = json.dumps(body, ensure_ascii=False).encode("utf-8")
+                writer.write(
+                    f"HTTP/1.1 {status} {STATUS_TEXT[status]}\r\n"
+                    f"Content-Type: application/json; charset=utf-8\r\n"
+                    f"Content-Length: {len(payload)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode("latin-1") + payload
+                )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host="127.0.0.1", port=8080):
+        server = await asyncio.start_server(self.handle, host, port)
+        async with server:
+            await server.serve_forever()
+
+    def close(self):
+        self.executor.shutdown(cancel_futures=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve panchang queries as JSON over HTTP.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--workers", type=int, default=4, help="size of the executor doing the Skyfield work")
+    parser.add_argument("--executor", choices=("thread", "process"), default="thread")
+    parser.add_argument("--cache-size", type=int, default=1024, help="answers kept in memory")
+    parser.add_argument("--cache-ttl", type=float, default=300, help="seconds an answer is served from memory")
+    args = parser.parse_args(argv)
+
+    service = PanchangService(args.workers, args.executor, args.cache_size, args.cache_ttl)
+    print(f"Serving panchang on http://{args.host}:{args.port}/")
+    try:
+        asyncio.run(service.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service.close()
+
+
+if __name__ == "__main__":
+    main()
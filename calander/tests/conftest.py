@@ -0,0 +1,39 @@
+import os
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from ind_panchang import ephemeris
+from ind_panchang.panchang import Panchang
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+KOLKATA = (22.5726, 88.3639, "Asia/Kolkata")
+
+
+def _kernel_path():
+    candidates = (
+        os.environ.get(ephemeris.EPHEMERIS_ENV),
+        os.path.join(HERE, os.pardir, ephemeris.EPHEMERIS_FILE),
+        ephemeris.EPHEMERIS_FILE,
+    )
+    return next((os.path.abspath(p) for p in candidates if p and os.path.exists(p)), None)
+
+
+@pytest.fixture(scope="session")
+def kernel():
+    """The local JPL kernel the tests run on; they never download one."""
+    path = _kernel_path()
+    if path is None:
+        pytest.skip(f"no local {ephemeris.EPHEMERIS_FILE}; set {ephemeris.EPHEMERIS_ENV} to run the ephemeris tests")
+    ephemeris.use_ephemeris(path)
+    return path
+
+
+@pytest.fixture
+def panchang(kernel):
+    return Panchang(*KOLKATA, name="Kolkata")
+
+
+@pytest.fixture
+def kolkata():
+    return ZoneInfo(KOLKATA[2])
@@ -0,0 +1,55 @@
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from ind_panchang.almanac import SAME_TITHI_TOLERANCE, build_almanac, iter_almanac, merge_chunks
+from ind_panchang.panchang import Panchang
+
+TOLERANCE = timedelta(milliseconds=1)
+
+
+def unshared_boundaries(festivals):
+    """(earlier, later) tithi festivals whose end and start are one transition reported at two times."""
+    spans = [(fest, start, end) for fest, start, end in festivals if start != end]
+    return [
+        (a[0], b[0]) for a in spans for b in spans
+        if a[2] != b[1] and abs(a[2] - b[1]) < SAME_TITHI_TOLERANCE
+    ]
+
+
+@pytest.fixture(scope="module")
+def serial(kernel):
+    p = Panchang(22.5726, 88.3639, "Asia/Kolkata")
+    return p, p.get_festivals_between(datetime(2025, 1, 1, tzinfo=p.zone), datetime(2026, 1, 1, tzinfo=p.zone))
+
+
+@pytest.mark.parametrize("mode", ["parallel", "streamed"])
+def test_chunked_almanac_matches_serial(serial, mode):
+    panchang, expected = serial
+    if mode == "parallel":
+        festivals = build_almanac(panchang, 2025, 2025, workers=2, chunk_months=1)
+    else:
+        festivals = list(iter_almanac(panchang, 2025, 2025))
+    assert [(fest, start.date()) for fest, start, _ in festivals] == [(fest, start.date()) for fest, start, _ in expected]
+    for (_, start, end), (_, serial_start, serial_end) in zip(festivals, expected):
+        assert abs(start - serial_start) < TOLERANCE and abs(end - serial_end) < TOLERANCE
+    assert unshared_boundaries(festivals) == []
+
+
+def test_merge_drops_repeats_and_snaps_boundaries():
+    zone = ZoneInfo("Asia/Kolkata")
+    t = datetime(2025, 10, 1, 19, 1, 41, tzinfo=zone)
+    navami = ("Navami", t - timedelta(hours=23), t)
+    first = [navami]
+    second = [
+        ("Navami", navami[1] + timedelta(microseconds=30), t + timedelta(microseconds=40)),  # the same tithi again
+        ("Dashami", t + timedelta(microseconds=40), t + timedelta(hours=24)),
+        ("Kojagari", t + timedelta(days=5), t + timedelta(days=6)),
+    ]
+    holiday = datetime(2025, 10, 2, tzinfo=zone)
+    merged = merge_chunks([first, second + [("Gandhi Jayanti", holiday, holiday)]])
+    assert merged[0] == navami
+    assert merged[1] == ("Dashami", t, t + timedelta(hours=24))
+    assert merged[2] == second[2]
+    assert merged[3] == ("Gandhi Jayanti", holiday, holiday)
@@ -0,0 +1,45 @@
+from datetime import date, datetime, timedelta
+
+from ind_panchang.batch import batch_daily_panchang, rise_set_many
+from ind_panchang.panchang import Panchang
+
+PLACES = [
+    (22.5726, 88.3639, "Asia/Kolkata", "Kolkata"),
+    (23.8315, 91.2868, "Asia/Kolkata", "Agartala"),
+    (23.8103, 90.4125, "Asia/Dhaka", "Dhaka"),
+    (51.5074, -0.1278, "Europe/London", "London"),
+    (69.6492, 18.9553, "Europe/Oslo", "Tromsø"),  # no sunset in early June
+]
+TOLERANCE = timedelta(seconds=1)
+
+
+def assert_close(a, b):
+    if a is None or b is None:
+        assert a is b
+    else:
+        assert abs(a - b) <= TOLERANCE
+
+
+def test_rise_set_many_matches_serial_search(kernel):
+    panchangs = [Panchang(*place) for place in PLACES]
+    days = [date(2025, 6, 5), date(2025, 12, 21)]
+    pairs = [(p, d) for p in panchangs for d in days]
+    batched = rise_set_many([p for p, _ in pairs], [d for _, d in pairs])
+    for (p, d), times in zip(pairs, batched):
+        serial = Panchang(p.latitude, p.longitude, p.zone)
+        for a, b in zip(times, serial.get_sunrise_sunset(d) + serial.get_moonrise_moonset(d)):
+            assert_close(a, b)
+
+
+def test_batch_daily_panchang_matches_each_place(kernel):
+    instant = datetime.fromisoformat("2025-10-01T06:00:00+05:30")
+    sheets = batch_daily_panchang(PLACES[:4], instant)
+    assert len(sheets) == 4
+    for place, sheet in zip(PLACES, sheets):
+        p = Panchang(*place)
+        serial = p.daily_panchang(instant.astimezone(p.zone))
+        assert sheet.keys() == serial.keys()
+        for field in ("date", "tithi", "paksha", "nakshatra", "yoga", "karana", "lunar_month", "bengali_date", "festivals"):
+            assert sheet[field] == serial[field], (place[3], field)
+        for field in ("sunrise", "sunset", "moonrise", "moonset"):
+            assert_close(sheet[field], serial[field])
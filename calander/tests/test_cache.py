@@ -0,0 +1,80 @@
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from ind_panchang import ephemeris, panchang as core
+from ind_panchang.cache import AlmanacCache, CachedPanchang, StaleCacheError
+from .conftest import KOLKATA
+
+TOLERANCE = timedelta(milliseconds=1)
+
+
+@pytest.fixture
+def cached(kernel, tmp_path):
+    return CachedPanchang(*KOLKATA, name="Kolkata", cache=AlmanacCache(str(tmp_path)))
+
+
+def assert_close(a, b):
+    if a is None or b is None:
+        assert a is b
+    else:
+        assert abs(a - b) <= TOLERANCE
+
+
+def test_angular_events_match_uncached(panchang, cached, kolkata):
+    start, end = datetime(2025, 9, 20, tzinfo=kolkata), datetime(2025, 10, 20, tzinfo=kolkata)
+    for kind in core.ANGULAR_EVENTS:
+        fresh = panchang.get_angular_events(kind, start, end)
+        for _ in range(2):  # computed, then read back from disk
+            stored = cached.get_angular_events(kind, start, end)
+            assert [s["name"] for s in stored] == [s["name"] for s in fresh]
+            for a, b in zip(stored, fresh):
+                assert_close(a["start"], b["start"])
+                assert_close(a["end"], b["end"])
+
+
+def test_rise_set_and_daily_sheet_match_uncached(panchang, cached, kolkata):
+    day = date(2025, 10, 1)
+    while day < date(2025, 10, 8):
+        for a, b in zip(cached.get_sunrise_sunset(day) + cached.get_moonrise_moonset(day),
+                        panchang.get_sunrise_sunset(day) + panchang.get_moonrise_moonset(day)):
+            assert_close(a, b)
+        day += timedelta(days=1)
+    moment = datetime(2025, 10, 2, 9, tzinfo=kolkata)
+    stored, fresh = cached.daily_panchang(moment), panchang.daily_panchang(moment)
+    for field in ("tithi", "paksha", "nakshatra", "yoga", "karana", "lunar_month", "bengali_date", "festivals"):
+        assert stored[field] == fresh[field]
+
+
+def test_eclipses_match_uncached(panchang, cached, kolkata):
+    start, end = datetime(2025, 1, 1, tzinfo=kolkata), datetime(2026, 1, 1, tzinfo=kolkata)
+    stored, fresh = list(cached.iter_eclipses(start, end)), list(panchang.iter_eclipses(start, end))
+    assert [(e["kind"], e["type"], e["visible"]) for e in stored] == [(e["kind"], e["type"], e["visible"]) for e in fresh]
+    for a, b in zip(stored, fresh):
+        assert_close(a["max"], b["max"])
+        assert a["magnitude"] == pytest.approx(b["magnitude"], abs=1e-6)
+
+
+def test_changed_settings_make_stores_stale(kernel, tmp_path, monkeypatch):
+    AlmanacCache(str(tmp_path)).store("geocentric")
+    monkeypatch.setattr(core, "AYANAMSHA", core.AYANAMSHA + 0.5)
+    cache = AlmanacCache(str(tmp_path))
+    with pytest.raises(StaleCacheError):
+        cache.store("geocentric")
+    cache.invalidate()
+    assert cache.store("geocentric").meta["coverage"] == {}
+
+
+def test_another_kernel_makes_stores_stale(kernel, tmp_path):
+    root = str(tmp_path / "cache")
+    AlmanacCache(root).store("geocentric")
+    AlmanacCache(root).store("geocentric")  # same kernel, same settings
+    subset = str(tmp_path / "subset.bsp")
+    ephemeris.subset_ephemeris(kernel, subset, 2024, 2026)
+    try:
+        ephemeris.use_ephemeris(subset)
+        with pytest.raises(StaleCacheError):
+            AlmanacCache(root).store("geocentric")
+    finally:
+        ephemeris.use_ephemeris(kernel)
+    AlmanacCache(root).store("geocentric")
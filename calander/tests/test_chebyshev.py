@@ -0,0 +1,73 @@
+import warnings
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from ind_panchang import chebyshev
+from ind_panchang.chebyshev import ChebyshevModel, apparent_positions
+from ind_panchang.panchang import ANGULAR_EVENTS, find_angular_transitions
+
+
+@pytest.fixture(scope="module")
+def model(kernel):
+    return ChebyshevModel.fit(2025, 2025)
+
+
+@pytest.fixture
+def fast_path(model):
+    assert chebyshev.install(model)
+    yield model
+    chebyshev.uninstall()
+
+
+def test_verified_error_is_within_tolerance(model):
+    errors = model.verify()
+    assert set(errors) == set(chebyshev.QUANTITIES)
+    assert max(errors.values()) < chebyshev.TOLERANCE_DEGREES
+
+
+def test_evaluate_matches_skyfield(model):
+    tt = np.linspace(model.start_tt + 0.1, model.end_tt - 0.1, 500)
+    for name, exact in zip(chebyshev.QUANTITIES, apparent_positions(tt)):
+        error = (model.evaluate(name, tt) - exact + 180) % 360 - 180
+        assert np.max(np.abs(error)) < chebyshev.TOLERANCE_DEGREES, name
+    assert model.covers(tt) and not model.covers([model.end_tt + 1])
+
+
+def test_save_and_load(model, tmp_path):
+    path = str(tmp_path / "model.npz")
+    model.save(path)
+    loaded = ChebyshevModel.load(path)
+    tt = np.linspace(model.start_tt, model.end_tt - 1e-6, 50)
+    assert np.array_equal(loaded.evaluate("moon_longitude", tt), model.evaluate("moon_longitude", tt))
+
+
+def test_install_rejects_an_inaccurate_model(model):
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        assert not chebyshev.install(model, tolerance=1e-12)
+    assert chebyshev.installed is None
+    assert "exceeds" in str(caught[0].message)
+
+
+def test_fast_path_transitions_match_exact(panchang, model, kolkata):
+    start, end = datetime(2025, 3, 1, tzinfo=kolkata), datetime(2025, 4, 15, tzinfo=kolkata)
+    t0, t1 = panchang.ts.from_datetime(start), panchang.ts.from_datetime(end)
+    exact = {kind: find_angular_transitions(kind, t0, t1) for kind in ANGULAR_EVENTS}
+    assert chebyshev.install(model)
+    try:
+        for kind, (times, indices) in exact.items():
+            fast_times, fast_indices = find_angular_transitions(kind, t0, t1)
+            assert list(fast_indices) == list(indices), kind
+            assert np.max(np.abs(fast_times.tt - times.tt)) * 86400 < 0.001, kind
+        assert chebyshev.model_for(t0.tt) is model
+    finally:
+        chebyshev.uninstall()
+
+
+def test_outside_the_model_skyfield_is_used(fast_path, panchang, kolkata):
+    moment = datetime(2030, 1, 1, tzinfo=kolkata)
+    assert chebyshev.model_for(panchang.ts.from_datetime(moment).tt) is None
+    assert panchang.sun_longitude(moment) == pytest.approx(
+        apparent_positions(panchang.ts.from_datetime(moment).tt)[0], abs=1e-9)
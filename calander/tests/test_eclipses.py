@@ -0,0 +1,57 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import pytest
+
+from ind_panchang import panchang as core
+from ind_panchang.panchang import Panchang
+
+
+@pytest.fixture
+def empty_index(monkeypatch):
+    index = {}
+    monkeypatch.setattr(core, "eclipse_index", index)
+    return index
+
+
+def test_concurrent_lookups_see_the_eclipse(kernel, empty_index):
+    moment = datetime.fromisoformat("2025-09-07T22:00:00+05:30")
+    places = [Panchang(22.5726, 88.3639), Panchang(28.6139, 77.2090), Panchang(19.0760, 72.8777), Panchang(12.9716, 77.5946)]
+    with ThreadPoolExecutor(max_workers=len(places)) as pool:
+        found = list(pool.map(lambda p: p.detect_eclipses(moment), places))
+    for eclipses in found:
+        assert [name for name, _, _, _ in eclipses] == ["Total Lunar Eclipse"]
+    assert sum(value is not None for value in empty_index.values()) == 1
+
+
+def test_no_eclipse_is_stored_once(kernel, empty_index):
+    ts = core.get_timescale()
+    full_moon = ts.utc(2025, 10, 7, 3, 48)  # far from a node
+    assert core.global_lunar_eclipse(full_moon) is None
+    assert empty_index == {core.syzygy_number(full_moon): None}
+
+
+def test_compute_once_stores_nothing_on_error():
+    index = {}
+
+    def fail():
+        raise RuntimeError("no ephemeris")
+    with pytest.raises(RuntimeError):
+        core.compute_once(index, 1, fail)
+    assert index == {} and not core._key_locks
+    assert core.compute_once(index, 1, lambda: None) is None
+    assert index == {1: None}
+
+
+def test_compute_once_runs_once_under_contention():
+    index, calls = {}, []
+    never = threading.Event()
+
+    def slow(value):
+        calls.append(value)
+        never.wait(0.2)
+        return value
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda _: core.compute_once(index, "k", slow, 42), range(8)))
+    assert results == [42] * 8 and calls == [42]
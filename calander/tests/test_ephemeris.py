@@ -0,0 +1,32 @@
+import numpy as np
+import pytest
+
+from ind_panchang import ephemeris
+from ind_panchang.chebyshev import apparent_positions
+
+
+def test_subset_kernel_gives_the_same_positions(kernel, tmp_path):
+    subset = str(tmp_path / "subset.bsp")
+    targets = ephemeris.subset_ephemeris(kernel, subset, 2024, 2026)
+    assert set(targets) >= {3, 10, 301, 399} | set(ephemeris.DEFLECTOR_TARGETS)
+    tt = ephemeris.get_timescale().utc(2025, 1, np.arange(1, 366)).tt
+    full = apparent_positions(tt)
+    try:
+        ephemeris.use_ephemeris(subset)
+        assert ephemeris.ephemeris_path() == subset
+        assert ephemeris.get_ephemeris().spk.segments[0].start_jd > 2460000
+        ephemeris.preload()
+        for a, b in zip(apparent_positions(tt), full):
+            assert np.array_equal(a, b)
+    finally:
+        ephemeris.use_ephemeris(kernel)
+    assert ephemeris.ephemeris_path() == kernel
+
+
+def test_subset_rejects_bad_requests(kernel, tmp_path):
+    with pytest.raises(ValueError, match="pluto"):
+        ephemeris.subset_ephemeris(kernel, str(tmp_path / "x.bsp"), 2024, 2026, bodies=("sun", "pluto"))
+    with pytest.raises(ValueError, match="end_year"):
+        ephemeris.subset_ephemeris(kernel, str(tmp_path / "x.bsp"), 2026, 2024)
+    with pytest.raises(ValueError, match="covers"):
+        ephemeris.subset_ephemeris(kernel, str(tmp_path / "x.bsp"), 1700, 1800)
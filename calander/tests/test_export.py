@@ -0,0 +1,106 @@
+import csv
+import io
+import json
+from datetime import date, datetime, timedelta
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from ind_panchang import festival_registry
+from ind_panchang.export import _ics_escape, _ics_line, export, write_csv, write_ics, write_jsonl
+from ind_panchang.records import Festival, Span, SpanArray
+
+ZONE = ZoneInfo("Asia/Kolkata")
+START = datetime(2025, 10, 1, 14, 37, 12, 250000, tzinfo=ZONE)
+
+
+def festivals():
+    return [
+        Festival("Maha Navami", date(2025, 10, 1), START, START + timedelta(hours=22, minutes=3)),
+        Festival("Rabindra Jayanti", date(2025, 5, 9), datetime(2025, 5, 9, tzinfo=ZONE), datetime(2025, 5, 9, tzinfo=ZONE)),
+    ]
+
+
+def unfold(text):
+    return text.replace("\r\n ", "")
+
+
+def test_jsonl_round_trip():
+    out = io.StringIO()
+    assert write_jsonl(festivals(), out) == 2
+    loaded = []
+    for line in out.getvalue().splitlines():
+        d = json.loads(line)
+        d["date"] = date.fromisoformat(d["date"])
+        d["start"], d["end"] = datetime.fromisoformat(d["start"]), datetime.fromisoformat(d["end"])
+        loaded.append(Festival.from_dict(d))
+    assert loaded == festivals()
+
+
+def test_csv_round_trip(panchang, kolkata):
+    spans = [Span.from_dict(s) for s in panchang.get_angular_events(
+        "tithi", datetime(2025, 10, 1, tzinfo=kolkata), datetime(2025, 10, 5, tzinfo=kolkata))]
+    out = io.StringIO(newline="")
+    assert write_csv(spans, out) == len(spans)
+    rows = list(csv.DictReader(io.StringIO(out.getvalue(), newline="")))
+    assert list(rows[0]) == list(Span.csv_fields)
+    for row, span in zip(rows, spans):
+        assert row["name"] == span.name and int(row["index"]) == span.index
+        assert datetime.fromisoformat(row["start"]) == span.start
+        assert datetime.fromisoformat(row["end"]) == span.end
+
+
+def test_span_array_round_trip(panchang, kolkata):
+    spans = panchang.get_angular_events("nakshatra", datetime(2025, 10, 1, tzinfo=kolkata), datetime(2025, 10, 10, tzinfo=kolkata))
+    array = SpanArray.from_spans("nakshatra", spans, kolkata)
+    assert [s.name for s in array] == [s["name"] for s in spans]
+    for record, span in zip(array, spans):
+        assert abs(record.start - span["start"]) < timedelta(microseconds=1)
+    middle = spans[3]["start"] + timedelta(minutes=1)
+    assert [s.name for s in array.between(middle, middle + timedelta(minutes=1))] == [spans[3]["name"]]
+
+
+def test_ics_lines_are_folded_at_75_octets():
+    line = "SUMMARY:" + "Durga Puja দুর্গাপূজা · " * 12
+    out = io.StringIO()
+    _ics_line(out, line)
+    text = out.getvalue()
+    assert text.endswith("\r\n")
+    physical = text[:-2].split("\r\n")
+    assert len(physical) > 1
+    assert all(len(p.encode("utf-8")) <= 75 for p in physical)
+    assert all(p.startswith(" ") for p in physical[1:])
+    assert unfold(text)[:-2] == line
+
+
+def test_ics_calendar():
+    out = io.StringIO(newline="")
+    assert write_ics(festivals(), out, calendar_name="Kolkata, 2025") == 2
+    lines = unfold(out.getvalue()).split("\r\n")
+    assert lines[0] == "BEGIN:VCALENDAR" and lines[-2] == "END:VCALENDAR" and lines[-1] == ""
+    assert "X-WR-CALNAME:Kolkata\\, 2025" in lines
+    assert lines.count("BEGIN:VEVENT") == lines.count("END:VEVENT") == 2
+    assert "DTSTART:20251001T090712Z" in lines
+    assert "DTSTART;VALUE=DATE:20250509" in lines and "DTEND;VALUE=DATE:20250510" in lines
+    assert all(len(line.encode("utf-8")) <= 75 for line in out.getvalue().split("\r\n"))
+
+
+@pytest.mark.parametrize("first, last", [(date(2025, 12, 1), date(2025, 12, 31)), (date(2026, 4, 1), date(2026, 4, 30))])
+def test_ics_date_festivals_once_all_day(panchang, first, last):
+    records = [Festival.from_tuple(entry) for entry in panchang.get_monthly_festivals(first.year, first.month)]
+    out = io.StringIO(newline="")
+    write_ics(records, out)
+    events = unfold(out.getvalue()).split("BEGIN:VEVENT\r\n")[1:]
+    by_date = festival_registry.festivals_by_date(first, last)
+    assert by_date
+    for day, names in by_date.items():
+        for name in names:
+            matching = [e.split("\r\n") for e in events if "SUMMARY:" + _ics_escape(name) + "\r\n" in e]
+            assert len(matching) == 1, name
+            assert "DTSTART;VALUE=DATE:" + day.strftime("%Y%m%d") in matching[0]
+            assert "DTEND;VALUE=DATE:" + (day + timedelta(days=1)).strftime("%Y%m%d") in matching[0]
+
+
+def test_unknown_format():
+    with pytest.raises(ValueError, match="xml"):
+        export(festivals(), io.StringIO(), "xml")
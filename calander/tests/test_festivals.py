@@ -0,0 +1,41 @@
+from datetime import date, datetime
+
+import pytest
+
+from ind_panchang.festivals import FestivalRegistry
+
+
+def test_registry_indexes_rules():
+    registry = FestivalRegistry()
+    rule = {"name": "Kojagari", "lunar_month": "Ashwin", "paksha": "Shukla", "tithi": 15}
+    registry.add(rule)
+    registry.add(dict(rule))  # the same rule twice is kept once
+    registry.add({"name": "Netaji Jayanti", "solar_date": "01-23"})
+    registry.add({"name": "Shab-e-Barat", "hijri_date": "08-15"})
+    assert len(registry) == 3
+    assert registry.tithi_festivals("Ashwin", "Shukla", 15) == ["Kojagari"]
+    assert registry.tithi_festivals("Ashwin", "Shukla", 15, observance="sunrise") == []
+    assert registry.rules_named("kojagari")[0]["observance"] == "tithi"
+    by_date = registry.festivals_by_date(date(2025, 1, 1), date(2025, 12, 31))
+    assert by_date[date(2025, 1, 23)] == ["Netaji Jayanti"]
+    assert ["Shab-e-Barat"] in by_date.values()
+
+
+@pytest.mark.parametrize("rule", [
+    {"lunar_month": "Ashwin", "paksha": "Shukla", "tithi": 15},
+    {"name": "x", "lunar_month": "Ashwin", "paksha": "Shukla", "tithi": 16},
+    {"name": "x", "lunar_month": "Ashvin", "paksha": "Shukla", "tithi": 1},
+    {"name": "x", "lunar_month": "Ashwin", "paksha": "Shukla", "tithi": 1, "observance": "noon"},
+    {"name": "x", "solar_date": "01-23", "hijri_date": "08-15"},
+])
+def test_registry_rejects_bad_rules(rule):
+    with pytest.raises(ValueError):
+        FestivalRegistry([rule])
+
+
+def test_date_festivals_are_listed_once(panchang):
+    christmas = [(start, end) for name, start, end in panchang.get_monthly_festivals(2025, 12) if name == "Christmas"]
+    midnight = datetime(2025, 12, 25, tzinfo=panchang.zone)
+    assert christmas == [(midnight, midnight)]  # not again with whichever tithi was running
+    day = panchang.daily_panchang(datetime(2025, 12, 25, 9, tzinfo=panchang.zone))
+    assert day["festivals"].count("Christmas") == 1
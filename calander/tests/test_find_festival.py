@@ -0,0 +1,47 @@
+import os
+from datetime import datetime, timedelta
+
+import pytest
+
+from ind_panchang import instrument
+from ind_panchang import panchang as core
+from ind_panchang.festivals import BUILTIN_RULES, RULES_DIR, FestivalRegistry
+
+TOLERANCE = timedelta(milliseconds=10)
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    """The built-in rules plus the Bengali ones (several kept at sunrise), for this test only."""
+    registry = FestivalRegistry(BUILTIN_RULES)
+    registry.load(os.path.join(RULES_DIR, "bengali.json"))
+    monkeypatch.setattr(core, "festival_registry", registry)
+    return registry
+
+
+@pytest.mark.parametrize("year", [2023, 2025])  # 2023 has an adhika (repeated) Shravan
+def test_find_festival_matches_a_brute_force_scan(panchang, registry, year):
+    names = sorted({rule["name"] for rule in registry.rules if "tithi" in rule})
+    start = datetime(year, 1, 1, tzinfo=panchang.zone)
+    scan = panchang.get_festivals_between(start - timedelta(days=3), start.replace(year=year + 1) + timedelta(days=3))
+    for name in names:
+        expected = [(s, e) for fest, s, e in scan if fest == name and s.year == year]
+        found = panchang.find_festival(name, year)
+        assert [f["date"] for f in found] == [s.date() for s, _ in expected], name
+        for f, (s, e) in zip(found, expected):
+            if s != e:  # sunrise festivals are listed by the scan at midnight of their day
+                assert abs(f["start"] - s) < TOLERANCE and abs(f["end"] - e) < TOLERANCE, name
+
+
+def test_find_festival_observes_less_than_scanning(panchang, registry):
+    names = ["Ram Navami", "Guru Purnima", "Janmashtami", "Diwali", "Holi", "Durga Puja (Navami)", "Saraswati Puja", "Rath Yatra"]
+    panchang.find_festival("Holi", 2025)  # sankranti and sunrise caches warm for both
+    with instrument.instrumented() as stats:
+        found = [panchang.find_festival(name, 2025) for name in names]
+        searched = stats.totals()["observations"]
+    with instrument.instrumented() as stats:
+        panchang.get_festivals_between(datetime(2025, 1, 1, tzinfo=panchang.zone), datetime(2026, 1, 1, tzinfo=panchang.zone))
+        scanned = stats.totals()["observations"]
+    assert sum(map(bool, found)) == 7  # Guru Purnima with Punarvasu is rare
+    # ephemeris observations, not wall time: the counts are the same on every machine
+    assert searched < scanned / 4
@@ -0,0 +1,26 @@
+from datetime import date, timedelta
+
+import pytest
+from hijridate import Gregorian
+
+from ind_panchang.hijri import FIRST_DATE, LAST_DATE, HijriTable, hijri_date, month_starts
+
+
+def test_hijri_table_matches_hijridate():
+    table = HijriTable(date(2024, 1, 1), date(2026, 12, 31))
+    day = table.start_date
+    while day <= table.end_date:
+        assert table.hijri_date(day) == Gregorian(day.year, day.month, day.day).to_hijri().datetuple()
+        day += timedelta(days=1)
+    assert hijri_date(date(2025, 3, 1)) == table.hijri_date(date(2025, 3, 1))
+    assert hijri_date(FIRST_DATE - timedelta(days=1)) is None
+    assert hijri_date(LAST_DATE + timedelta(days=1)) is None
+    with pytest.raises(ValueError):
+        table.hijri_date(date(2027, 1, 1))
+
+
+def test_dates_for_and_month_starts():
+    table = HijriTable(date(2025, 1, 1), date(2025, 12, 31))
+    ramadan = table.dates_for(9, 1)
+    assert ramadan == [date(2025, 3, 1)]
+    assert (date(2025, 3, 1), 1446, 9) in month_starts(date(2025, 2, 15), date(2025, 3, 15))
@@ -0,0 +1,27 @@
+from datetime import datetime
+
+from ind_panchang import instrument
+
+
+def test_counters_and_stages(panchang, kolkata):
+    moment = datetime(2025, 10, 1, 9, tzinfo=kolkata)
+    plain = panchang.daily_panchang(moment)
+    with instrument.instrumented() as stats:
+        counted = panchang.daily_panchang(moment)
+    assert counted == plain
+    stages = stats.stages()
+    assert stages["daily_panchang"]["calls"] == 1
+    assert "angular_events.tithi" in stages
+    totals = stats.totals()
+    assert totals["searches"] > 0 and totals["observations"] > 0
+    assert stages["daily_panchang"]["searches"] <= totals["searches"]
+    assert "daily_panchang" in stats.report()
+
+
+def test_nothing_is_recorded_while_off(monkeypatch):
+    monkeypatch.setattr(instrument, "enabled", False)
+    instrument.reset()
+    with instrument.stage("off"):
+        instrument.count("searches")
+    assert instrument.stats.stages() == {}
+    assert instrument.stats.totals()["searches"] == 0
@@ -0,0 +1,86 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from ind_panchang.live import LIVE_KINDS, LivePanchang, SAME_TRANSITION
+
+
+@pytest.fixture
+def start(kolkata):
+    return datetime(2025, 9, 28, 3, 0, tzinfo=kolkata)
+
+
+def run_until(live, end):
+    """Steps a simulated clock from one transition to the next, like run() without sleeping."""
+    steps = []
+    while live.next_transition()[0] <= end:
+        when, _ = live.next_transition()
+        steps.append((when, live.advance(when)))
+    return steps
+
+
+def test_transitions_fire_in_time_order(panchang, start):
+    live = LivePanchang(panchang, horizon=timedelta(days=1), now=start)
+    assert set(live.current) == set(LIVE_KINDS)
+    assert all(span["start"] <= start < span["end"] for span in live.current.values())
+    fired = []
+    live.on_transition(lambda kind, span, previous: fired.append((span["start"], kind)))
+    tithis = []
+    live.on_transition(lambda kind, span, previous: tithis.append(span["name"]), kinds=("tithi",))
+
+    steps = run_until(live, start + timedelta(days=4))
+    applied = [(span["start"], kind) for _, transitions in steps for kind, span, _ in transitions]
+    assert fired == applied
+    assert [when for when, _ in fired] == sorted(when for when, _ in fired)
+    for when, transitions in steps:
+        assert all(span["start"] <= when for _, span, _ in transitions)
+    kinds = {kind for _, kind in fired}
+    assert {"tithi", "nakshatra", "yoga", "karana", "sun"} <= kinds
+
+    expected = panchang.get_angular_events("tithi", start, start + timedelta(days=4))
+    assert tithis == [s["name"] for s in expected[1:]]
+
+
+def test_spans_are_continuous(panchang, start):
+    live = LivePanchang(panchang, kinds=("tithi", "karana", "sun", "moon_phase"), horizon=timedelta(hours=12), now=start)
+    end = start + timedelta(days=10)
+    while live.next_transition()[0] <= end:
+        transitions = live.advance(live.next_transition()[0])
+        for kind, span, previous in transitions:
+            assert abs(span["start"] - previous["end"]) <= SAME_TRANSITION, kind
+            assert live.current[kind] is span
+    assert live.snapshot()["sun"] in ("Day", "Night")
+
+
+def test_sun_spans_match_rise_set(panchang, start):
+    live = LivePanchang(panchang, kinds=("sun",), now=start)
+    sunrise, sunset = panchang.get_sunrise_sunset(start.date())
+    assert live.current["sun"]["name"] == "Night"
+    assert abs(live.current["sun"]["end"] - sunrise) < timedelta(milliseconds=1)
+    assert abs(live.upcoming["sun"][0]["end"] - sunset) < timedelta(milliseconds=1)
+
+
+def test_unknown_kind(panchang):
+    with pytest.raises(ValueError, match="sunrise"):
+        LivePanchang(panchang, kinds=("tithi", "sunrise"))
+
+
+def test_rise_set_memo_is_left_alone(panchang, start):
+    panchang.get_rise_set_table(start.date() - timedelta(days=3), start.date() + timedelta(days=3))
+    memo = dict(panchang.rise_set_days)
+    live = LivePanchang(panchang, kinds=("sun",), horizon=timedelta(hours=12), now=start)
+    live.advance(start + timedelta(days=5))
+    assert panchang.rise_set_days == memo
+
+
+def test_current_at_applies_due_transitions(panchang, start):
+    live = LivePanchang(panchang, kinds=("tithi", "sun"), now=start)
+    later = start + timedelta(days=3)
+    stale = live.current["tithi"]
+    current = live.current_at(later)
+    assert stale["end"] <= later
+    for kind, span in current.items():
+        assert span["start"] <= later < span["end"], kind
+    assert live.current == current
+    with pytest.raises(ValueError):
+        live.current_at(start)  # the clock does not run backwards
@@ -0,0 +1,40 @@
+from datetime import date, timedelta
+
+import numpy as np
+
+from ind_panchang.panchang import Panchang, RISESET_DTYPE
+
+TOLERANCE = timedelta(seconds=1)
+
+
+def assert_close(a, b):
+    if a is None or b is None:
+        assert a is b
+    else:
+        assert abs(a - b) <= TOLERANCE
+
+
+def test_table_matches_day_by_day_search(panchang):
+    start, end = date(2025, 10, 1), date(2025, 10, 15)
+    table = panchang.get_rise_set_table(start, end)
+    assert table.dtype == RISESET_DTYPE and len(table) == 14
+    assert list(table["day"]) == list(range(start.toordinal(), end.toordinal()))
+    day = start
+    while day < end:
+        fresh = Panchang(panchang.latitude, panchang.longitude, panchang.zone)  # nothing memoised
+        searched = fresh.get_sunrise_sunset(day) + fresh.get_moonrise_moonset(day)
+        assert panchang.rise_set_days[day.toordinal()] == panchang.get_sunrise_sunset(day) + panchang.get_moonrise_moonset(day)
+        for a, b in zip(panchang.get_sunrise_sunset(day) + panchang.get_moonrise_moonset(day), searched):
+            assert_close(a, b)
+        day += timedelta(days=1)
+
+
+def test_days_without_a_rise_or_set(kernel):
+    tromso = Panchang(69.6492, 18.9553, "Europe/Oslo")
+    table = tromso.get_rise_set_table(date(2025, 6, 10), date(2025, 6, 12))
+    assert np.isnan(table["sunrise"]).all() and np.isnan(table["sunset"]).all()
+    assert tromso.get_sunrise_sunset(date(2025, 6, 10)) == (None, None)
+
+
+def test_empty_range(panchang):
+    assert len(panchang.get_rise_set_table(date(2025, 1, 2), date(2025, 1, 2))) == 0
@@ -0,0 +1,100 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from ind_panchang import server
+from ind_panchang.server import PanchangService, compute, parse_query
+
+MONTH = "/month?lat=22.5726&lon=88.3639&year=2025&month=10"
+
+
+@pytest.fixture
+def service(kernel):
+    service = PanchangService(workers=4)
+    yield service
+    service.close()
+
+
+def test_identical_requests_share_one_computation(service):
+    async def burst():
+        return await asyncio.gather(*(service.respond("GET", MONTH) for _ in range(50)))
+    answers = asyncio.run(burst())
+    assert all(status == 200 for status, _ in answers)
+    assert all(body == answers[0][1] for _, body in answers)
+    assert answers[0][1] == compute(parse_query("/month", dict(lat="22.5726", lon="88.3639", year="2025", month="10")))
+    assert service.stats["computed"] == 1
+    assert service.stats["coalesced"] == 49
+    assert service.stats["requests"] == 50
+
+
+def test_process_workers_read_the_parent_ephemeris(kernel):
+    service = PanchangService(workers=2, executor="process")
+    try:
+        status, body = asyncio.run(service.respond("GET", MONTH))
+    finally:
+        service.close()
+    assert status == 200
+    assert body == compute(parse_query("/month", dict(lat="22.5726", lon="88.3639", year="2025", month="10")))
+
+
+def test_answers_are_cached_until_they_expire(service, monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(server.time, "monotonic", lambda: clock[0])
+    first = asyncio.run(service.respond("GET", MONTH))
+    again = asyncio.run(service.respond("GET", MONTH))
+    assert first == again
+    assert service.stats["computed"] == 1 and service.stats["cache_hits"] == 1
+    clock[0] += service.cache_ttl + 1
+    assert asyncio.run(service.respond("GET", MONTH)) == first
+    assert service.stats["computed"] == 2
+    status, stats = asyncio.run(service.respond("GET", "/stats"))
+    assert status == 200 and stats["cached"] == 1 and stats["in_flight"] == 0
+
+
+def test_cache_keeps_the_most_recently_used(kernel):
+    service = PanchangService(workers=1, cache_size=2)
+    try:
+        async def run():
+            for month in (1, 2, 1, 3, 1):
+                await service.respond("GET", f"/month?lat=22.57&lon=88.36&year=2025&month={month}")
+        asyncio.run(run())
+    finally:
+        service.close()
+    assert [key[-1] for key in service.cache] == [3, 1]
+    assert service.stats["computed"] == 3 and service.stats["cache_hits"] == 2
+
+
+@pytest.mark.parametrize("method, target, status", [
+    ("POST", MONTH, 405),
+    ("GET", "/week?lat=22.57&lon=88.36", 404),
+    ("GET", "/month?lon=88.36&year=2025&month=10", 400),
+    ("GET", "/month?lat=95&lon=88.36&year=2025&month=10", 400),
+    ("GET", "/month?lat=22.57&lon=88.36&year=2025&month=13", 400),
+    ("GET", "/day?lat=22.57&lon=88.36&zone=Mars/Olympus", 400),
+    ("GET", "/day?lat=22.57&lon=88.36&date=yesterday", 400),
+    ("GET", "/range?lat=22.57&lon=88.36&start=2025-10-01&end=2025-09-01", 400),
+    ("GET", "/festival?lat=22.57&lon=88.36&start_year=2025", 400),
+])
+def test_bad_requests(method, target, status):
+    service = PanchangService(workers=1)
+    try:
+        answer = asyncio.run(service.respond(method, target))
+    finally:
+        service.close()
+    assert answer[0] == status and "error" in answer[1]
+    assert service.stats["computed"] == 0
+
+
+def test_unknown_festival_is_a_bad_request(service):
+    status, body = asyncio.run(service.respond("GET", "/festival?lat=22.57&lon=88.36&name=Nowruzz&start_year=2025"))
+    assert status == 400 and "Nowruzz" in body["error"]
+
+
+def test_threads_sharing_a_place_get_serial_answers(kernel):
+    keys = [parse_query("/day", {"lat": "22.5726", "lon": "88.3639", "date": f"2025-09-{day:02d}T21:00"}) for day in range(1, 13)]
+    server.get_place.cache_clear()
+    with ThreadPoolExecutor(max_workers=6) as pool:
+        parallel = list(pool.map(compute, keys))
+    server.get_place.cache_clear()
+    assert parallel == [compute(key) for key in keys]